@@ -291,7 +291,11 @@ class ReportGenerator:
         # logo_filename was determined earlier when searching for the logo
 
         # Make sure we're using just the filenames for images
-        # (Flask URL handling will be done at runtime)
+        # (Flask URL handling will be done at runtime); graphs are None without matplotlib
+        graphs = {
+            name: os.path.basename(path) if path else None
+            for name, path in insights["graphs"].items()
+        }
         html_output = template.render(
             start_date=start_date,
             end_date=end_date,
@@ -299,9 +303,9 @@ class ReportGenerator:
             users=insights["users"],
             repos=insights["repositories"],
             # Use just the filenames
-            trends=os.path.basename(insights["graphs"]["trends"]),
-            types=os.path.basename(insights["graphs"]["types"]),
-            user_comparison=os.path.basename(insights["graphs"]["users"]),
+            trends=graphs["trends"],
+            types=graphs["types"],
+            user_comparison=graphs["users"],
             table_html=table_html,
             logo_path=logo_filename,
             generation_date=datetime.now().strftime("%B %d, %Y at %H:%M"),
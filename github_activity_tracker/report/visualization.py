@@ -2,15 +2,29 @@
 
 import os
 
-# Set the Matplotlib backend to 'Agg' for non-interactive mode (thread-safe)
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
 import pandas as pd
 
 from ..utils.logging_config import logger
 
+try:
+    # Set the Matplotlib backend to 'Agg' for non-interactive mode (thread-safe)
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+except ImportError:
+    matplotlib = None
+    plt = None
+
+
+def _require_matplotlib():
+    """Raise a helpful ImportError when the optional plotting dependency is missing."""
+    if plt is None:
+        raise ImportError(
+            "matplotlib is required for charts; "
+            "install it with: pip install github-activity-tracker[viz]"
+        )
+
 
 class ActivityVisualizer:
     """Class for creating visualizations from GitHub activity data."""
@@ -59,12 +73,18 @@ class ActivityVisualizer:
         for repo, count in repo_activity_counts.items():
             logger.info(f"{repo}: {count} activities")
 
-        logger.debug("Generating visualizations...")
-
-        # Create visualizations
-        trends_graph = ActivityVisualizer.plot_activity_trends(df, output_dir)
-        types_graph = ActivityVisualizer.plot_activity_types(df, output_dir)
-        user_graph = ActivityVisualizer.plot_user_comparison(df, output_dir)
+        # Create visualizations, unless the optional plotting dependency is missing
+        if plt is None:
+            logger.warning(
+                "matplotlib is not installed - charts skipped "
+                "(install them with: pip install github-activity-tracker[viz])"
+            )
+            trends_graph = types_graph = user_graph = None
+        else:
+            logger.debug("Generating visualizations...")
+            trends_graph = ActivityVisualizer.plot_activity_trends(df, output_dir)
+            types_graph = ActivityVisualizer.plot_activity_types(df, output_dir)
+            user_graph = ActivityVisualizer.plot_user_comparison(df, output_dir)
 
         return {
             "total_activities": total_activities,
@@ -79,6 +99,7 @@ class ActivityVisualizer:
     @staticmethod
     def plot_activity_trends(df, output_dir=""):
         """Plot activity trends over time."""
+        _require_matplotlib()
         logger.debug("Generating activity trends plot")
 
         plt.figure(figsize=(12, 6))
@@ -133,6 +154,7 @@ class ActivityVisualizer:
     @staticmethod
     def plot_activity_types(df, output_dir=""):
         """Plot distribution of activity types."""
+        _require_matplotlib()
         logger.debug("Generating activity types plot")
 
         plt.figure(figsize=(10, 6))
@@ -192,6 +214,7 @@ class ActivityVisualizer:
     @staticmethod
     def plot_user_comparison(df, output_dir=""):
         """Plot activity comparison between users."""
+        _require_matplotlib()
         logger.debug("Generating user comparison plot")
 
         plt.figure(figsize=(12, 8))
@@ -4,20 +4,25 @@ This module provides functionality to send emails with GitHub activity reports
 as attachments, supporting both HTML and CSV formats.
 """
 
+import gzip
 import mimetypes
 import os
 import pathlib
+import queue
 import re
 import shutil
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from email.mime.application import MIMEApplication
+from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.image import MIMEImage
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from time import sleep
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     from weasyprint import CSS, HTML
@@ -29,6 +34,191 @@ except ImportError:
 
 from ..utils.logging_config import logger
 
+# CSV attachments larger than this many bytes are sent gzip-compressed
+GZIP_ATTACHMENT_THRESHOLD = 1024 * 1024
+
+# Errors that reject a single message while leaving the SMTP session usable
+MESSAGE_REJECTED_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+
+class SMTPPool:
+    """A thread-safe pool of logged-in SMTP connections for one account.
+
+    Connections are opened lazily, checked with NOOP before reuse and retired
+    after a number of messages, so concurrent senders share a few connections
+    instead of logging in for every message.
+    """
+
+    def __init__(
+        self,
+        smtp_server: str,
+        smtp_port: int,
+        username: str,
+        password: str,
+        use_tls: bool = True,
+        max_connections: int = 5,
+        max_messages_per_conn: int = 100,
+    ):
+        """Initialize the pool with SMTP settings and limits.
+
+        Args:
+            smtp_server: SMTP server address
+            smtp_port: SMTP server port
+            username: SMTP authentication username
+            password: SMTP authentication password
+            use_tls: Whether to use TLS encryption (default: True)
+            max_connections: Maximum number of open connections
+            max_messages_per_conn: Messages sent before a connection is retired
+        """
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_messages_per_conn = max_messages_per_conn
+        self._idle: "queue.Queue[Tuple[smtplib.SMTP, int]]" = queue.Queue(maxsize=max_connections)
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def connect(self, smtp: Optional[smtplib.SMTP] = None) -> smtplib.SMTP:
+        """Open and log in a connection, or reconnect an existing one.
+
+        Args:
+            smtp: Connection to reconnect in place (a new one is created if omitted)
+
+        Returns:
+            A logged-in SMTP connection
+        """
+        if smtp is None:
+            smtp = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        else:
+            smtp.connect(self.smtp_server, self.smtp_port)
+
+        try:
+            smtp.ehlo()
+            if self.use_tls:
+                smtp.starttls()
+            smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    @contextmanager
+    def acquire(self, messages: int = 1) -> Iterator[smtplib.SMTP]:
+        """Check out a connection for the duration of a with-block.
+
+        The connection goes back to the pool when the block succeeds and is
+        closed when it raises.
+
+        Args:
+            messages: Number of messages the caller sends on the connection
+
+        Yields:
+            A logged-in SMTP connection
+        """
+        self._slots.acquire()
+        try:
+            smtp, sent = self._checkout()
+            try:
+                yield smtp
+            except BaseException:
+                self._quit(smtp)
+                raise
+
+            sent += messages
+            if sent >= self.max_messages_per_conn:
+                self._quit(smtp)
+            else:
+                self._idle.put_nowait((smtp, sent))
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                smtp, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(smtp)
+
+    def _checkout(self) -> Tuple[smtplib.SMTP, int]:
+        """Return a healthy idle connection with its message count, or a new one."""
+        while True:
+            try:
+                smtp, sent = self._idle.get_nowait()
+            except queue.Empty:
+                return self.connect(), 0
+
+            try:
+                if smtp.noop()[0] == 250:
+                    return smtp, sent
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.debug("Discarding SMTP connection that failed the NOOP check")
+            self._quit(smtp)
+
+    @staticmethod
+    def _quit(smtp: smtplib.SMTP) -> None:
+        """Close a connection, politely if the server is still there."""
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+
+# Pools shared by every EmailSender using the same account and TLS setting
+_smtp_pools: Dict[Tuple[str, int, str, bool], SMTPPool] = {}
+_smtp_pools_lock = threading.Lock()
+
+
+def get_smtp_pool(
+    smtp_server: str, smtp_port: int, username: str, password: str, use_tls: bool = True
+) -> SMTPPool:
+    """Return the shared connection pool for an SMTP account, creating it if needed.
+
+    A pool is never changed once created. When the password for an account
+    changes, a new pool replaces the registered one and the old pool's idle
+    connections, logged in with the old password, are closed.
+
+    Args:
+        smtp_server: SMTP server address
+        smtp_port: SMTP server port
+        username: SMTP authentication username
+        password: SMTP authentication password
+        use_tls: Whether to use TLS encryption (default: True)
+
+    Returns:
+        The pool keyed by (smtp_server, smtp_port, username, use_tls)
+    """
+    key = (smtp_server, smtp_port, username, use_tls)
+    with _smtp_pools_lock:
+        stale = _smtp_pools.get(key)
+        if stale is not None and stale.password == password:
+            return stale
+        pool = _smtp_pools[key] = SMTPPool(smtp_server, smtp_port, username, password, use_tls)
+
+    if stale is not None:
+        logger.debug(f"SMTP password changed for {username}, closing old connections")
+        stale.close()
+    return pool
+
+
+def close_smtp_pools() -> None:
+    """Close the idle connections of every shared SMTP pool.
+
+    The pools stay registered, so senders holding one keep sharing it and
+    simply reconnect on their next send.
+    """
+    with _smtp_pools_lock:
+        pools = list(_smtp_pools.values())
+    for pool in pools:
+        pool.close()
+
 
 class EmailSender:
     """Email sender for GitHub Activity reports.
@@ -62,9 +252,22 @@ class EmailSender:
         self.password = password
         self.use_tls = use_tls
         self.default_sender = default_sender or username
+        self.pool = get_smtp_pool(smtp_server, smtp_port, username, password, use_tls)
         logger.debug(f"EmailSender initialized with server: {smtp_server}:{smtp_port}")
 
-    def send_report(  # noqa: C901
+    def __enter__(self) -> "EmailSender":
+        """Return the sender so it can be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the pooled SMTP connections when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the idle connections of this sender's SMTP pool."""
+        self.pool.close()
+
+    def send_report(
         self,
         recipient: str,
         subject: str = "GitHub Activity Report",
@@ -98,7 +301,203 @@ class EmailSender:
         Returns:
             True if the email was sent successfully, False otherwise
         """
-        global plain_content, html_content, embedded_images, attachments
+        built = self._build_message(
+            recipient, subject, sender, report_path, date_from, date_to, format_name, cc, bcc
+        )
+        if built is None:
+            return False
+        msg, all_recipients = built
+
+        # Send the email
+        for attempt in range(3):  # Try up to 3 times
+            try:
+                # A connection that fails here is closed, so a retry gets a fresh one
+                with self.pool.acquire() as server:
+                    server.sendmail(msg["From"], all_recipients, msg.as_string())
+                logger.info(f"Email sent to {recipient}")
+                return True
+
+            except Exception as e:
+                if attempt < 2:  # Not the last attempt
+                    logger.warning(f"Email send attempt {attempt + 1} failed: {e}. Retrying...")
+                    sleep(2)  # Short delay before retry
+                else:
+                    logger.error(f"Failed to send email after 3 attempts: {e}")
+                    return False
+
+    def send_reports_batch(self, reports: List[Dict]) -> List[bool]:
+        """Send several report emails over a single SMTP connection.
+
+        Messages are sent back to back on one connection with RSET between
+        envelopes, instead of connecting and logging in once per email. A
+        message the server rejects is skipped; only a connection failure
+        stops the rest of the batch.
+
+        Args:
+            reports: One dict per email holding send_report keyword arguments
+                (recipient, subject, report_path, format_name, ...)
+
+        Returns:
+            A success flag for each report, in order
+        """
+        results = [False] * len(reports)
+        messages = []
+        for index, report in enumerate(reports):
+            report = {key: value for key, value in report.items() if key != "activities"}
+            built = self._build_message(**report)
+            if built is not None:
+                messages.append((index, *built))
+
+        if not messages:
+            return results
+
+        try:
+            with self.pool.acquire(messages=len(messages)) as server:
+                for position, (index, msg, all_recipients) in enumerate(messages):
+                    if position:
+                        self._reset(server)
+
+                    try:
+                        server.send_message(msg, from_addr=msg["From"], to_addrs=all_recipients)
+                    except MESSAGE_REJECTED_ERRORS as e:
+                        logger.error(f"Email to {msg['To']} was rejected: {e}")
+                        continue
+                    results[index] = True
+                    logger.info(f"Email sent to {msg['To']}")
+        except Exception as e:
+            logger.error(f"Batch send stopped after {sum(results)} of {len(reports)} emails: {e}")
+
+        return results
+
+    def send_report_multi(
+        self,
+        recipients: List[str],
+        subject: str = "GitHub Activity Report",
+        sender: str = None,
+        report_path: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        format_name: str = "html",
+    ) -> List[bool]:
+        """Send the same report to several recipients, one email each.
+
+        The message, including its encoded attachments, is built once and
+        only the To header is swapped between recipients. A recipient the
+        server rejects is skipped; only a connection failure stops the rest.
+
+        Args:
+            recipients: Recipient email addresses
+            subject: Email subject
+            sender: Sender email address (uses default if not provided)
+            report_path: Path to the report file or directory
+            date_from: Start date for the report (optional)
+            date_to: End date for the report (optional)
+            format_name: Format of the report ('html' or 'csv')
+
+        Returns:
+            A success flag for each recipient, in order
+        """
+        results = [False] * len(recipients)
+        if not recipients:
+            return results
+
+        built = self._build_message(
+            recipients[0], subject, sender, report_path, date_from, date_to, format_name
+        )
+        if built is None:
+            return results
+        msg, _ = built
+
+        try:
+            with self.pool.acquire(messages=len(recipients)) as server:
+                for index, recipient in enumerate(recipients):
+                    if index:
+                        self._reset(server)
+                    try:
+                        self._deliver(server, msg, recipient)
+                    except MESSAGE_REJECTED_ERRORS as e:
+                        logger.error(f"Email to {recipient} was rejected: {e}")
+                        continue
+                    results[index] = True
+        except Exception as e:
+            logger.error(
+                f"Multi send stopped after {sum(results)} of {len(recipients)} emails: {e}"
+            )
+
+        return results
+
+    def send_reports_parallel(self, jobs: List[Dict], max_workers: int = 4) -> List[bool]:
+        """Send several report emails concurrently over the connection pool.
+
+        Each job is sent with send_report from a worker thread, so the SMTP
+        round-trips of independent emails overlap instead of queueing up.
+
+        Args:
+            jobs: One dict per email holding send_report keyword arguments
+            max_workers: Maximum number of emails in flight at once
+
+        Returns:
+            A success flag for each job, in order
+        """
+        if not jobs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda job: self.send_report(**job), jobs))
+
+    def _deliver(self, smtp: smtplib.SMTP, msg: MIMEMultipart, recipient: str) -> None:
+        """Address a prepared message to one recipient and send it."""
+        del msg["To"]
+        msg["To"] = recipient
+        smtp.send_message(msg, from_addr=msg["From"], to_addrs=[recipient])
+        logger.info(f"Email sent to {recipient}")
+
+    def _reset(self, smtp: smtplib.SMTP) -> None:
+        """Reset the SMTP session between two messages on the same connection."""
+        try:
+            smtp.rset()
+        except smtplib.SMTPServerDisconnected:
+            # Some servers close the connection instead of resetting it
+            logger.debug("SMTP server disconnected on RSET, reconnecting")
+            self.pool.connect(smtp)
+
+    def _build_message(  # noqa: C901
+        self,
+        recipient: str,
+        subject: str = "GitHub Activity Report",
+        sender: str = None,
+        report_path: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        format_name: str = "html",
+        cc: List[str] = None,
+        bcc: List[str] = None,
+    ) -> Optional[Tuple[MIMEMultipart, List[str]]]:
+        """Build the report email and its envelope recipients.
+
+        Args:
+            recipient: Recipient email address
+            subject: Email subject
+            sender: Sender email address (uses default if not provided)
+            report_path: Path to the report file or directory
+            date_from: Start date for the report (optional)
+            date_to: End date for the report (optional)
+            format_name: Format of the report ('html' or 'csv')
+            cc: List of CC recipients
+            bcc: List of BCC recipients
+
+        Returns:
+            Tuple of (message, all_recipients), or None if the email could not be built
+        """
+        if not report_path:
+            logger.error("No report path given, nothing to send")
+            return None
+        if not os.path.exists(report_path):
+            logger.error(f"Report not found at {report_path}")
+            return None
+
+        attachments: List = []
+        embedded_images: Dict = {}
         try:
             sender = sender or self.default_sender
 
@@ -125,51 +524,49 @@ class EmailSender:
                 date_from = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
                 date_to = datetime.now().strftime("%Y-%m-%d")
 
-            # Start with report path validation
-            if report_path:
-                # Convert to Path object for easier manipulation
-                report_dir = pathlib.Path(report_path)
-
-                # Check if it's a directory or a file
-                if report_dir.is_dir():
-                    # For HTML reports, there should be an index.html file
-                    if format_name.lower() == "html":
-                        html_path = report_dir / "index.html"
-                        if not html_path.exists():
-                            logger.error(f"HTML report not found at {html_path}")
-                            return False
-
-                        # Generate email content from HTML report
-                        html_content, plain_content, attachments, embedded_images = (
-                            self._prepare_html_report_email(html_path, report_dir)
-                        )
-
-                    else:  # CSV reports
-                        # For CSV reports, the report_path itself should be a CSV file
-                        # or a directory containing a CSV file
-                        csv_files = list(report_dir.glob("*.csv"))
-                        if not csv_files:
-                            logger.error(f"No CSV files found in {report_dir}")
-                            return False
-
-                        # Use the first CSV file found
-                        csv_path = csv_files[0]
-
-                        # Generate email content for CSV report
-                        html_content, plain_content, attachments = self._prepare_csv_report_email(
-                            csv_path
-                        )
-
-                else:  # It's a file
-                    # For CSV reports, the file should exist and be a CSV
-                    if format_name.lower() == "csv" and report_dir.suffix.lower() == ".csv":
-                        csv_path = report_dir
-                        html_content, plain_content, attachments = self._prepare_csv_report_email(
-                            csv_path
-                        )
-                    else:
-                        logger.error(f"Invalid report path: {report_path}")
-                        return False
+            # Convert to Path object for easier manipulation
+            report_dir = pathlib.Path(report_path)
+
+            # Check if it's a directory or a file
+            if report_dir.is_dir():
+                # For HTML reports, there should be an index.html file
+                if format_name.lower() == "html":
+                    html_path = report_dir / "index.html"
+                    if not html_path.exists():
+                        logger.error(f"HTML report not found at {html_path}")
+                        return None
+
+                    # Generate email content from HTML report
+                    html_content, plain_content, attachments, embedded_images = (
+                        self._prepare_html_report_email(html_path, report_dir)
+                    )
+
+                else:  # CSV reports
+                    # For CSV reports, the report_path itself should be a CSV file
+                    # or a directory containing a CSV file
+                    csv_files = list(report_dir.glob("*.csv"))
+                    if not csv_files:
+                        logger.error(f"No CSV files found in {report_dir}")
+                        return None
+
+                    # Use the first CSV file found
+                    csv_path = csv_files[0]
+
+                    # Generate email content for CSV report
+                    html_content, plain_content, attachments = self._prepare_csv_report_email(
+                        csv_path
+                    )
+
+            else:  # It's a file
+                # For CSV reports, the file should exist and be a CSV
+                if format_name.lower() == "csv" and report_dir.suffix.lower() == ".csv":
+                    csv_path = report_dir
+                    html_content, plain_content, attachments = self._prepare_csv_report_email(
+                        csv_path
+                    )
+                else:
+                    logger.error(f"Invalid report path: {report_path}")
+                    return None
 
             # Add the email body
             text_part = MIMEText(plain_content, "plain")
@@ -180,74 +577,72 @@ class EmailSender:
             msg.attach(html_part)
 
             # Add any embedded images
-            if format_name.lower() == "html" and "embedded_images" in locals():
-                for cid, (img_path, _) in embedded_images.items():
-                    with open(img_path, "rb") as img:
-                        img_data = img.read()
-                        image = MIMEImage(img_data)
-                        image.add_header("Content-ID", f"<{cid}>")
-                        image.add_header("Content-Disposition", "inline")
-                        msg.attach(image)
+            for cid, (img_path, _) in embedded_images.items():
+                with open(img_path, "rb") as img:
+                    image = MIMEImage(img.read())
+                image.add_header("Content-ID", f"<{cid}>")
+                image.add_header("Content-Disposition", "inline")
+                msg.attach(image)
 
             # Add attachments
-            if "attachments" in locals():
-                for attachment in attachments:
-                    if isinstance(attachment, dict):
-                        # New format with additional metadata
-                        file_path = attachment["path"]
-                        label = attachment.get("label", os.path.basename(file_path))
-                        mime_type = attachment.get("mime_type")
-                    else:
-                        # Old format - just a path string
-                        file_path = attachment
-                        label = os.path.basename(file_path)
-                        mime_type = None
-
-                    # Determine mime type if not provided
-                    if not mime_type:
-                        mime_type, _ = mimetypes.guess_type(file_path)
-                        if not mime_type:
-                            # Default to octet-stream if we can't determine the type
-                            mime_type = "application/octet-stream"
-
-                    with open(file_path, "rb") as f:
-                        attachment_data = f.read()
-
-                        # Create MIME attachment
-                        if mime_type.startswith("application/"):
-                            part = MIMEApplication(attachment_data, Name=label)
-                        else:
-                            # For other types, use the base MIME type
-                            part = MIMEBase(*mime_type.split("/", 1))
-                            part.set_payload(attachment_data)
-
-                        # Add header
-                        part.add_header("Content-Disposition", f'attachment; filename="{label}"')
-                        msg.attach(part)
-
-            # Send the email
-            for attempt in range(3):  # Try up to 3 times
-                try:
-                    with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                        if self.use_tls:
-                            server.starttls()
-
-                        server.login(self.username, self.password)
-                        server.sendmail(sender, all_recipients, msg.as_string())
-                        logger.info(f"Email sent to {recipient}")
-                        return True
-
-                except Exception as e:
-                    if attempt < 2:  # Not the last attempt
-                        logger.warning(f"Email send attempt {attempt + 1} failed: {e}. Retrying...")
-                        sleep(2)  # Short delay before retry
-                    else:
-                        logger.error(f"Failed to send email after 3 attempts: {e}")
-                        return False
+            for attachment in attachments:
+                if isinstance(attachment, dict):
+                    # New format with additional metadata
+                    file_path = attachment["path"]
+                    label = attachment.get("label", os.path.basename(file_path))
+                    mime_type = attachment.get("mime_type")
+                else:
+                    # Old format - just a path string
+                    file_path = attachment
+                    label = os.path.basename(file_path)
+                    mime_type = None
+
+                msg.attach(self._create_attachment_part(file_path, label, mime_type))
+
+            return msg, all_recipients
 
         except Exception as e:
             logger.exception(f"Error preparing email: {e}")
-            return False
+            return None
+
+    def _create_attachment_part(
+        self, file_path: str, label: str, mime_type: Optional[str] = None
+    ) -> MIMEBase:
+        """Create the MIME part for one attachment.
+
+        CSV files above GZIP_ATTACHMENT_THRESHOLD bytes are gzip-compressed
+        and attached as ``<label>.gz``.
+
+        Args:
+            file_path: Path to the file to attach
+            label: File name shown to the recipient
+            mime_type: MIME type of the file (guessed from the path if omitted)
+
+        Returns:
+            The base64-encoded MIME part
+        """
+        # Determine mime type if not provided
+        if not mime_type:
+            mime_type, _ = mimetypes.guess_type(file_path)
+            if not mime_type:
+                # Default to octet-stream if we can't determine the type
+                mime_type = "application/octet-stream"
+
+        with open(file_path, "rb") as f:
+            attachment_data = f.read()
+
+        if mime_type == "text/csv" and len(attachment_data) > GZIP_ATTACHMENT_THRESHOLD:
+            original_size = len(attachment_data)
+            attachment_data = gzip.compress(attachment_data, compresslevel=1)
+            logger.debug(f"Compressed {label} from {original_size} to {len(attachment_data)} bytes")
+            label = f"{label}.gz"
+            mime_type = "application/gzip"
+
+        part = MIMEBase(*mime_type.split("/", 1), name=label)
+        part.set_payload(attachment_data)
+        encoders.encode_base64(part)
+        part.add_header("Content-Disposition", f'attachment; filename="{label}"')
+        return part
 
     def _prepare_html_report_email(
         self, html_path: Union[str, pathlib.Path], report_dir: Union[str, pathlib.Path]
@@ -1,6 +1,7 @@
 """Utility functions for file handling."""
 
 import os
+import re
 from datetime import datetime
 
 from .logging_config import logger
@@ -8,6 +9,9 @@ from .logging_config import logger
 # Default location for users file
 DEFAULT_USERS_FILE = "github_users.txt"
 
+# One username per line: surrounding whitespace trimmed, blank and # comment lines skipped
+_USER_RE = re.compile(r"^[^\S\n]*([^\s#][^\n]*?)[^\S\n]*$", re.MULTILINE)
+
 
 def load_users_from_file(file_path):
     """Load GitHub usernames from a file, one username per line.
@@ -15,19 +19,15 @@ def load_users_from_file(file_path):
     Lines starting with # are treated as comments and ignored.
     """
     try:
-        with open(file_path, "r") as f:
-            # Read lines, strip whitespace, filter out empty lines and comments
-            users = []
-            for line in f.readlines():
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    users.append(line)
-
-            if not users:
-                logger.warning(f"⚠️ No users found in {file_path}")
-            else:
-                logger.debug(f"👥 Loaded {len(users)} users from {file_path}")
-            return users
+        # Read the whole file in one call and pick the usernames out in a single regex scan
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            users = _USER_RE.findall(f.read())
+
+        if not users:
+            logger.warning(f"⚠️ No users found in {file_path}")
+        else:
+            logger.debug(f"👥 Loaded {len(users)} users from {file_path}")
+        return users
     except FileNotFoundError:
         logger.error(f"User file {file_path} not found.")
         return None
@@ -1,17 +1,223 @@
 """User management module for the GitHub Activity Tracker."""
 
+import base64
+import hashlib
+import hmac
 import json
 import logging
 import os
 import secrets
+import stat
+import tempfile
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Errors that mean the users file is unreadable or malformed
+_LOAD_ERRORS = (OSError, json.JSONDecodeError, KeyError, TypeError)
+if ijson is not None:
+    _LOAD_ERRORS += (ijson.JSONError,)
+
+# Hasher for new passwords; bcrypt hashes written by older versions are still
+# verified and upgraded on the next successful login
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+ARGON2_PREFIX = "$argon2"
+
+# Marks legacy bcrypt hashes computed over an HMAC-SHA256 pre-hash of the password.
+# bcrypt hashes without it were computed over the raw password.
+PREHASH_PREFIX = "$sha256$"
+
+# Size of the secret key mixed into every password pre-hash
+PEPPER_BYTES = 32
+
+# Hash of a random throwaway secret, checked against when a username is unknown
+# so that lookups for missing users cost as much as a real password check
+_DUMMY_HASH = (
+    "$argon2id$v=19$m=65536,t=2,p=2$KpwpPBNGoUEYTIQGr3OjSQ"
+    "$S8DH0dJKS0Ipix11vw79+ZZMgPM03e7yrnwr9ksBEl0"
+)
+
+# Optional user record fields and their defaults. password_hash is left out on
+# purpose: its absence marks records that still need migrating.
+_USER_DEFAULTS = (("is_admin", False), ("email", None), ("full_name", None))
+
+# Locations searched, in order, when no users file is given explicitly
+USERS_FILE_CANDIDATES = (
+    Path("github_activity_tracker", "data", "users.json"),
+    Path("data", "users.json"),
+    Path("users.json"),
+)
+
+
+@lru_cache(maxsize=1)
+def resolve_users_file() -> Optional[str]:
+    """Find the users.json file in the default locations.
+
+    Candidates are resolved against the working directory at the time of the
+    first call, and the lookup is cached, so repeated calls do not stat the
+    candidates again.
+
+    Returns:
+        Absolute path of the first existing candidate, or None if none exists.
+    """
+    cwd = Path.cwd()
+    found = next((cwd / path for path in USERS_FILE_CANDIDATES if (cwd / path).is_file()), None)
+    return str(found) if found else None
+
+
+def _prehash(password: str, pepper: bytes) -> bytes:
+    """Pre-hash a password with HMAC-SHA256 before it is hashed for storage.
+
+    Mixing in the pepper means a leaked users file alone is not enough to
+    brute-force passwords. The pre-hash is always a 44-byte token, which also
+    keeps legacy bcrypt hashes from ignoring input past 72 bytes.
+
+    Args:
+        password: The plaintext password
+        pepper: Secret key kept outside the users file
+
+    Returns:
+        Base64-encoded HMAC digest of the password
+    """
+    return base64.b64encode(hmac.new(pepper, password.encode("utf-8"), hashlib.sha256).digest())
+
+
+def _hash_password(password: str, pepper: bytes) -> str:
+    """Hash a password for storage.
+
+    Args:
+        password: The plaintext password
+        pepper: Secret key kept outside the users file
+
+    Returns:
+        The argon2id hash to store
+    """
+    return _password_hasher.hash(_prehash(password, pepper))
+
+
+def _check_password(password: str, password_hash: str, pepper: Optional[bytes]) -> bool:
+    """Check a password against a stored hash.
+
+    Args:
+        password: The plaintext password to check
+        password_hash: The stored argon2id or legacy bcrypt hash
+        pepper: Secret key the hash was computed with, if pre-hashed
+
+    Returns:
+        True if the password matches, False otherwise
+    """
+    if password_hash.startswith(ARGON2_PREFIX):
+        if pepper is None:
+            return False
+        try:
+            return _password_hasher.verify(password_hash, _prehash(password, pepper))
+        except VerificationError:
+            return False
+
+    # Legacy bcrypt hashes are plain ASCII, so encode the stored hash once up front
+    stored_hash = password_hash.encode("ascii")
+    if password_hash.startswith(PREHASH_PREFIX):
+        if pepper is None:
+            return False
+        return bcrypt.checkpw(_prehash(password, pepper), stored_hash[len(PREHASH_PREFIX) :])
+
+    # Legacy hash computed over the raw password
+    return bcrypt.checkpw(password.encode("utf-8"), stored_hash)
+
+
+def _needs_rehash(password_hash: str) -> bool:
+    """Check whether a stored hash should be replaced with a fresh argon2id hash.
+
+    Args:
+        password_hash: The stored hash
+
+    Returns:
+        True for legacy bcrypt hashes and argon2 hashes with outdated parameters
+    """
+    if not password_hash.startswith(ARGON2_PREFIX):
+        return True
+    return _password_hasher.check_needs_rehash(password_hash)
+
+
+def _read_pepper(pepper_file: str) -> bytes:
+    """Read the pepper from disk.
+
+    Args:
+        pepper_file: Path of the file holding the pepper
+
+    Returns:
+        The pepper bytes
+
+    Raises:
+        ValueError: If the file holds fewer than PEPPER_BYTES bytes
+    """
+    with open(pepper_file, "rb") as f:
+        pepper = f.read()
+
+    if len(pepper) < PEPPER_BYTES:
+        raise ValueError(f"Password pepper file {pepper_file} is truncated ({len(pepper)} bytes)")
+    return pepper
+
+
+def _load_pepper(pepper_file: str, create: bool = True) -> bytes:
+    """Read the pepper from disk, creating it on first use.
+
+    The pepper is written with 0600 permissions next to, but not inside, the
+    users file. Losing it invalidates every pre-hashed password, so a missing
+    file is only replaced when no stored hash depends on it.
+
+    Args:
+        pepper_file: Path of the file holding the pepper
+        create: Whether a missing pepper file may be created
+
+    Returns:
+        The pepper bytes
+
+    Raises:
+        FileNotFoundError: If the pepper file is missing and create is False
+        ValueError: If the pepper file is truncated
+    """
+    try:
+        return _read_pepper(pepper_file)
+    except FileNotFoundError:
+        if not create:
+            raise FileNotFoundError(
+                f"Password pepper file {pepper_file} is missing but stored hashes depend on it"
+            ) from None
+
+    pepper_dir = os.path.dirname(pepper_file) or "."
+    os.makedirs(pepper_dir, exist_ok=True)
+
+    # Write the pepper under a temporary name and link it into place, so other
+    # processes never read a partially written file
+    fd, tmp_path = tempfile.mkstemp(dir=pepper_dir, prefix=".pepper.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(secrets.token_bytes(PEPPER_BYTES))
+        try:
+            os.link(tmp_path, pepper_file)
+        except FileExistsError:
+            # Another process created it first
+            return _read_pepper(pepper_file)
+    finally:
+        os.unlink(tmp_path)
+
+    logger.info(f"Created password pepper file: {pepper_file}")
+    return _read_pepper(pepper_file)
+
 
 @dataclass
 class User:
@@ -24,22 +230,21 @@ class User:
     full_name: Optional[str] = None
     password_hash: Optional[str] = None
 
-    def set_password(self, plain_password: str) -> None:
+    def set_password(self, plain_password: str, pepper: bytes) -> None:
         """Hash and set the user's password.
 
         Args:
             plain_password: The plaintext password to hash and store
+            pepper: Secret key used to pre-hash the password
         """
-        # Generate a salt and hash the password
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(plain_password.encode("utf-8"), salt)
-        self.password_hash = hashed.decode("utf-8")
+        self.password_hash = _hash_password(plain_password, pepper)
 
-    def verify_password(self, plain_password: str) -> bool:
+    def verify_password(self, plain_password: str, pepper: bytes) -> bool:
         """Verify if the provided password matches the stored hash.
 
         Args:
             plain_password: The plaintext password to check
+            pepper: Secret key used to pre-hash the password
 
         Returns:
             bool: True if the password matches, False otherwise
@@ -47,7 +252,39 @@ class User:
         if not self.password_hash:
             return False
 
-        return bcrypt.checkpw(plain_password.encode("utf-8"), self.password_hash.encode("utf-8"))
+        return _check_password(plain_password, self.password_hash, pepper)
+
+
+def _normalize_user(data: Dict[str, Any]) -> None:
+    """Fill in missing optional fields of a user record in place.
+
+    Records are normalized once when they enter the manager, so lookups can
+    index optional fields directly.
+
+    Args:
+        data: User record to normalize.
+    """
+    for key, default in _USER_DEFAULTS:
+        data.setdefault(key, default)
+
+
+def _user_from_dict(data: Dict[str, Any], _user_cls=User) -> User:
+    """Build a User from a normalized user record.
+
+    Args:
+        data: User record as stored in the users file.
+
+    Returns:
+        User object populated from the record.
+    """
+    return _user_cls(
+        data["user_id"],
+        data["username"],
+        data["is_admin"],
+        data["email"],
+        data["full_name"],
+        data.get("password_hash"),
+    )
 
 
 class UserManager:
@@ -66,6 +303,8 @@ class UserManager:
             users_file = os.path.join(base_dir, "data", "users.json")
 
         self.users_file = users_file
+        self.pepper_file = os.path.splitext(users_file)[0] + ".pepper"
+        self._pepper: Optional[bytes] = None
         self.users: Dict[str, Dict[str, Any]] = {}
         self.needs_migration = False
         self.load_users()
@@ -76,6 +315,20 @@ class UserManager:
             self.migrate_passwords()
             self.save_users()
 
+    @property
+    def pepper(self) -> bytes:
+        """Secret key used to pre-hash passwords, loaded on first use."""
+        if self._pepper is None:
+            self._pepper = _load_pepper(self.pepper_file, create=not self._has_peppered_hashes())
+        return self._pepper
+
+    def _has_peppered_hashes(self) -> bool:
+        """Check whether any stored hash was computed with the pepper."""
+        return any(
+            (data.get("password_hash") or "").startswith((ARGON2_PREFIX, PREHASH_PREFIX))
+            for data in self.users.values()
+        )
+
     def load_users(self) -> bool:
         """Load users from the JSON file.
 
@@ -83,28 +336,22 @@ class UserManager:
             True if successful, False otherwise.
         """
         try:
-            if not os.path.exists(self.users_file):
+            try:
+                fp = open(self.users_file, "rb")
+            except FileNotFoundError:
                 logger.warning(f"Users file not found: {self.users_file}")
                 return False
 
-            with open(self.users_file, "r") as f:
-                data = json.load(f)
+            with fp:
+                users = self._read_users(fp)
 
-            if not isinstance(data, dict) or "users" not in data:
+            if users is None:
                 logger.error(f"Invalid users file format: {self.users_file}")
                 return False
 
-            # Create a lookup by user_id
-            self.users = {user["user_id"]: user for user in data["users"]}
-
-            # Check if any users have plaintext passwords
-            for _, user_data in self.users.items():
-                # If 'password' exists but 'password_hash' doesn't, we need migration
-                if "password" in user_data and "password_hash" not in user_data:
-                    self.needs_migration = True
-                    break
+            self.users = users
 
-            logger.info(f"Loaded {len(self.users)} users from {self.users_file}")
+            logger.debug(f"Loaded {len(self.users)} users from {self.users_file}")
 
             if self.needs_migration:
                 logger.warning(
@@ -113,38 +360,135 @@ class UserManager:
 
             return True
 
-        except Exception as e:
+        except _LOAD_ERRORS as e:
             logger.error(f"Error loading users: {e}")
             return False
 
-    def save_users(self) -> bool:
+    def _read_users(self, f: BinaryIO) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Parse user records from an open users file.
+
+        Args:
+            f: Binary file handle positioned at the start of the users file.
+
+        Returns:
+            Lookup of user data by user_id, or None if the file format is invalid.
+        """
+        users_array_seen = False
+
+        if ijson is not None:
+
+            def events() -> Iterator[Tuple[str, str, Any]]:
+                # Note whether a top-level users array exists; items() alone would
+                # yield nothing for a file without one
+                nonlocal users_array_seen
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if prefix == "users" and event == "start_array":
+                        users_array_seen = True
+                    yield prefix, event, value
+
+            # Stream user records one at a time instead of building the whole tree
+            records = ijson.items(events(), "users.item")
+        else:
+            data = json.load(f)
+
+            if not isinstance(data, dict) or "users" not in data:
+                return None
+
+            records = data["users"]
+
+        # Create a lookup by user_id
+        users = {}
+        for user_data in records:
+            if not self._add_user_record(users, user_data):
+                return None
+
+        if ijson is not None and not users_array_seen:
+            return None
+
+        return users
+
+    def _add_user_record(self, users: Dict[str, Dict[str, Any]], user_data: Dict[str, Any]) -> bool:
+        """Normalize a user record read from the users file and add it to the lookup.
+
+        Args:
+            users: Lookup of user data by user_id being built.
+            user_data: User record as read from the file.
+
+        Returns:
+            True if the record was added, False if it lacks required fields.
+        """
+        if "user_id" not in user_data or "username" not in user_data:
+            return False
+
+        _normalize_user(user_data)
+
+        # Scrub plaintext backups written by older versions; a resave is
+        # needed so they no longer persist on disk
+        if user_data.pop("_old_password", None) is not None:
+            self.needs_migration = True
+
+        # If 'password' exists but 'password_hash' doesn't, we need migration
+        if "password" in user_data and "password_hash" not in user_data:
+            self.needs_migration = True
+
+        users[user_data["user_id"]] = user_data
+        return True
+
+    def save_users(self, pretty: bool = False) -> bool:
         """Save users to the JSON file.
 
+        The file is written to a temporary sibling first and then renamed over
+        the target, so a crash mid-write never leaves a truncated users file.
+        An existing file keeps its permissions; a new one is created as 0600.
+
+        Args:
+            pretty: Indent the JSON output for human inspection (default: compact)
+
         Returns:
             True if successful, False otherwise.
         """
+        tmp_path = None
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.users_file), exist_ok=True)
+            users_dir = os.path.dirname(self.users_file) or "."
+            os.makedirs(users_dir, exist_ok=True)
 
             # Format for JSON file
             data = {"users": list(self.users.values())}
 
-            with open(self.users_file, "w") as f:
-                json.dump(data, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(dir=users_dir, prefix=".users.", suffix=".json.tmp")
+            with os.fdopen(fd, "w") as f:
+                if pretty:
+                    json.dump(data, f, indent=2)
+                else:
+                    json.dump(data, f, separators=(",", ":"))
 
-            logger.info(f"Saved {len(self.users)} users to {self.users_file}")
+            # mkstemp creates the file as 0600; keep the permissions of the file it replaces
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(self.users_file).st_mode))
+            except FileNotFoundError:
+                pass
+
+            os.replace(tmp_path, self.users_file)
+            tmp_path = None
+
+            logger.debug(f"Saved {len(self.users)} users to {self.users_file}")
             return True
 
-        except Exception as e:
+        except (OSError, TypeError) as e:
             logger.error(f"Error saving users: {e}")
             return False
 
+        finally:
+            # Clean up the temporary file if the write did not complete
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
     def migrate_passwords(self) -> None:
         """Migrate plaintext passwords to secure hashed passwords."""
         migration_count = 0
 
-        for _, user_data in self.users.items():
+        for user_data in self.users.values():
             # Skip users that already have password_hash
             if "password_hash" in user_data:
                 continue
@@ -153,15 +497,8 @@ class UserManager:
             if "password" in user_data:
                 plaintext_password = user_data["password"]
 
-                # Generate salt and hash password
-                salt = bcrypt.gensalt()
-                password_hash = bcrypt.hashpw(plaintext_password.encode("utf-8"), salt)
-
                 # Store password hash
-                user_data["password_hash"] = password_hash.decode("utf-8")
-
-                # Create a backup of the original password with a different key
-                user_data["_old_password"] = user_data["password"]
+                user_data["password_hash"] = _hash_password(plaintext_password, self.pepper)
 
                 # Remove plaintext password
                 del user_data["password"]
@@ -187,16 +524,7 @@ class UserManager:
         if not user_data:
             return None
 
-        user = User(
-            user_id=user_data["user_id"],
-            username=user_data["username"],
-            is_admin=user_data.get("is_admin", False),
-            email=user_data.get("email"),
-            full_name=user_data.get("full_name"),
-            password_hash=user_data.get("password_hash"),
-        )
-
-        return user
+        return _user_from_dict(user_data)
 
     def authenticate(self, username: str, password: str) -> Optional[User]:
         """Authenticate a user with username and password.
@@ -208,14 +536,23 @@ class UserManager:
         Returns:
             User object if authentication succeeds, None otherwise.
         """
+        try:
+            pepper = self.pepper
+        except (OSError, ValueError) as e:
+            logger.error(f"Could not load password pepper: {e}")
+            return None
+
         # Find user by username
         user_data = None
-        for _, data in self.users.items():
-            if data.get("username") == username:
+        for data in self.users.values():
+            if data["username"] == username:
                 user_data = data
                 break
 
         if not user_data:
+            # Spend the same hashing work as a real check so response time does not
+            # reveal whether the username exists
+            _check_password(password, _DUMMY_HASH, pepper)
             logger.warning(f"User not found: {username}")
             return None
 
@@ -223,16 +560,7 @@ class UserManager:
 
         # Check for password hash first
         if "password_hash" in user_data:
-            try:
-                # Verify using bcrypt
-                if bcrypt.checkpw(
-                    password.encode("utf-8"), user_data["password_hash"].encode("utf-8")
-                ):
-                    authenticated = True
-                else:
-                    logger.warning(f"Invalid password (hash) for user: {username}")
-            except Exception as e:
-                logger.error(f"Error verifying password hash: {e}")
+            authenticated = self._verify_and_upgrade(user_data, password)
 
         # Fallback to plaintext password if hash verification failed or not available
         # This ensures backward compatibility during migration
@@ -244,14 +572,11 @@ class UserManager:
 
             # Automatically migrate this user
             try:
-                salt = bcrypt.gensalt()
-                password_hash = bcrypt.hashpw(password.encode("utf-8"), salt)
-                user_data["password_hash"] = password_hash.decode("utf-8")
-                user_data["_old_password"] = user_data["password"]
+                user_data["password_hash"] = _hash_password(password, self.pepper)
                 del user_data["password"]
                 self.save_users()
                 logger.info(f"Automatically migrated password for user {username}")
-            except Exception as e:
+            except ValueError as e:
                 logger.error(f"Auto-migration failed for user {username}: {e}")
         else:
             logger.warning(f"Invalid password for user: {username}")
@@ -260,16 +585,37 @@ class UserManager:
             return None
 
         # Return user object
-        user = User(
-            user_id=user_data["user_id"],
-            username=user_data["username"],
-            is_admin=user_data.get("is_admin", False),
-            email=user_data.get("email"),
-            full_name=user_data.get("full_name"),
-            password_hash=user_data.get("password_hash"),
-        )
+        return _user_from_dict(user_data)
+
+    def _verify_and_upgrade(self, user_data: Dict[str, Any], password: str) -> bool:
+        """Check a password against a stored hash, upgrading legacy hashes on success.
 
-        return user
+        Args:
+            user_data: The stored user record holding a password_hash.
+            password: The password to verify.
+
+        Returns:
+            True if the password matches the stored hash, False otherwise.
+        """
+        username = user_data.get("username")
+        try:
+            if not _check_password(password, user_data["password_hash"], self.pepper):
+                logger.warning(f"Invalid password (hash) for user: {username}")
+                return False
+        except ValueError as e:
+            logger.error(f"Error verifying password hash: {e}")
+            return False
+
+        # Upgrade legacy bcrypt hashes now that the password is known
+        if _needs_rehash(user_data["password_hash"]):
+            try:
+                user_data["password_hash"] = _hash_password(password, self.pepper)
+                self.save_users()
+                logger.info(f"Upgraded password hash for user {username}")
+            except ValueError as e:
+                logger.error(f"Password hash upgrade failed for user {username}: {e}")
+
+        return True
 
     def add_user(self, user_data: Dict[str, Any]) -> Optional[User]:
         """Add a new user.
@@ -298,19 +644,19 @@ class UserManager:
 
         # Create a copy of the user data so we don't modify the original
         new_user_data = user_data.copy()
+        _normalize_user(new_user_data)
 
         # If plaintext password is provided, hash it
         if "password" in new_user_data and "password_hash" not in new_user_data:
             try:
                 # Hash the password
-                salt = bcrypt.gensalt()
-                password_hash = bcrypt.hashpw(new_user_data["password"].encode("utf-8"), salt)
-                new_user_data["password_hash"] = password_hash.decode("utf-8")
+                new_user_data["password_hash"] = _hash_password(
+                    new_user_data["password"], self.pepper
+                )
 
-                # Store original password as backup and then remove it
-                new_user_data["_old_password"] = new_user_data["password"]
+                # Remove the plaintext password
                 del new_user_data["password"]
-            except Exception as e:
+            except ValueError as e:
                 logger.error(f"Error hashing password: {e}")
                 return None
 
@@ -321,14 +667,7 @@ class UserManager:
         self.save_users()
 
         # Return user object
-        return User(
-            user_id=new_user_data["user_id"],
-            username=new_user_data["username"],
-            is_admin=new_user_data.get("is_admin", False),
-            email=new_user_data.get("email"),
-            full_name=new_user_data.get("full_name"),
-            password_hash=new_user_data.get("password_hash"),
-        )
+        return _user_from_dict(new_user_data)
 
     def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Optional[User]:
         """Update an existing user.
@@ -351,15 +690,8 @@ class UserManager:
         # Handle password updates separately
         if "password" in user_data:
             try:
-                # Hash the new password
-                salt = bcrypt.gensalt()
-                password_hash = bcrypt.hashpw(user_data["password"].encode("utf-8"), salt)
-
-                # Store the hash
-                current_data["password_hash"] = password_hash.decode("utf-8")
-
-                # Store original password as backup
-                current_data["_old_password"] = user_data["password"]
+                # Hash and store the new password
+                current_data["password_hash"] = _hash_password(user_data["password"], self.pepper)
 
                 # Remove the password key from data to update
                 user_data_copy = user_data.copy()
@@ -368,7 +700,7 @@ class UserManager:
                 # Update other fields
                 for key, value in user_data_copy.items():
                     current_data[key] = value
-            except Exception as e:
+            except ValueError as e:
                 logger.error(f"Error updating password for user {user_id}: {e}")
                 return None
         else:
@@ -380,14 +712,7 @@ class UserManager:
         self.save_users()
 
         # Return updated user object
-        return User(
-            user_id=current_data["user_id"],
-            username=current_data["username"],
-            is_admin=current_data.get("is_admin", False),
-            email=current_data.get("email"),
-            full_name=current_data.get("full_name"),
-            password_hash=current_data.get("password_hash"),
-        )
+        return _user_from_dict(current_data)
 
     def delete_user(self, user_id: str) -> bool:
         """Delete a user.
@@ -410,23 +735,21 @@ class UserManager:
 
         return True
 
+    def iter_usernames(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over user IDs and usernames without building User objects.
+
+        Returns:
+            Iterator of (user_id, username) tuples.
+        """
+        return ((data["user_id"], data["username"]) for data in self.users.values())
+
     def list_users(self) -> List[User]:
         """List all users.
 
         Returns:
             List of User objects.
         """
-        return [
-            User(
-                user_id=data["user_id"],
-                username=data["username"],
-                is_admin=data.get("is_admin", False),
-                email=data.get("email"),
-                full_name=data.get("full_name"),
-                password_hash=data.get("password_hash"),
-            )
-            for data in self.users.values()
-        ]
+        return [_user_from_dict(data) for data in self.users.values()]
 
     def change_password(self, user_id: str, new_password: str) -> bool:
         """Change a user's password.
@@ -444,27 +767,23 @@ class UserManager:
             return False
 
         try:
-            # Hash the new password
-            salt = bcrypt.gensalt()
-            password_hash = bcrypt.hashpw(new_password.encode("utf-8"), salt)
-
-            # Update the user data
-            self.users[user_id]["password_hash"] = password_hash.decode("utf-8")
+            # Hash the new password and update the user data
+            self.users[user_id]["password_hash"] = _hash_password(new_password, self.pepper)
 
-            # If there was an old plaintext password, back it up
+            # Drop any leftover plaintext password
             if "password" in self.users[user_id]:
-                self.users[user_id]["_old_password"] = self.users[user_id]["password"]
                 del self.users[user_id]["password"]
 
             # Save users file
             self.save_users()
-            logger.info(f"Password changed successfully for user {user_id}")
+            logger.debug(f"Password changed successfully for user {user_id}")
             return True
-        except Exception as e:
+        except ValueError as e:
             logger.error(f"Error changing password for user {user_id}: {e}")
             return False
 
-    def generate_random_password(self, length: int = 12) -> str:
+    @staticmethod
+    def generate_random_password(length: int = 12) -> str:
         """Generate a secure random password.
 
         Args:
@@ -477,29 +796,37 @@ class UserManager:
         return secrets.token_urlsafe(length)
 
 
-# Global user manager instance
-user_manager = UserManager()
+# Global user manager instance, created on first use
+_user_manager: Optional[UserManager] = None
+
+
+def _get_manager() -> UserManager:
+    """Return the global user manager, loading the users file on first call."""
+    global _user_manager
+    if _user_manager is None:
+        _user_manager = UserManager()
+    return _user_manager
 
 
 # Convenience functions
 def authenticate_user(username: str, password: str) -> Optional[User]:
     """Authenticate a user."""
-    return user_manager.authenticate(username, password)
+    return _get_manager().authenticate(username, password)
 
 
 def get_user_by_id(user_id: str) -> Optional[User]:
     """Get a user by ID."""
-    return user_manager.get_user(user_id)
+    return _get_manager().get_user(user_id)
 
 
 def add_user(user_data: Dict[str, Any]) -> Optional[User]:
     """Add a new user."""
-    return user_manager.add_user(user_data)
+    return _get_manager().add_user(user_data)
 
 
 def list_users() -> List[User]:
     """List all users."""
-    return user_manager.list_users()
+    return _get_manager().list_users()
 
 
 def create_user(
@@ -524,7 +851,7 @@ def create_user(
         "email": email,
         "is_admin": is_admin,
     }
-    return user_manager.add_user(user_data)
+    return _get_manager().add_user(user_data)
 
 
 def change_password(user_id: str, new_password: str) -> bool:
@@ -537,7 +864,7 @@ def change_password(user_id: str, new_password: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    return user_manager.change_password(user_id, new_password)
+    return _get_manager().change_password(user_id, new_password)
 
 
 def generate_random_password(length: int = 12) -> str:
@@ -549,4 +876,4 @@ def generate_random_password(length: int = 12) -> str:
     Returns:
         A secure random password
     """
-    return user_manager.generate_random_password(length)
+    return UserManager.generate_random_password(length)
@@ -3,7 +3,6 @@
 
 import argparse
 import logging
-import os
 import sys
 from getpass import getpass
 from typing import Optional
@@ -13,6 +12,7 @@ from github_activity_tracker.web.auth.user_manager import (
     change_password,
     create_user,
     generate_random_password,
+    resolve_users_file,
 )
 
 # Set up logging
@@ -22,17 +22,12 @@ logging.basicConfig(
 logger = logging.getLogger("user_management")
 
 
-def find_users_file() -> Optional[str]:
-    """Find the users.json file in default locations."""
-    possible_paths = [
-        os.path.join("github_activity_tracker", "data", "users.json"),
-        os.path.join("data", "users.json"),
-        "users.json",
-    ]
-
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
+def find_user_id(user_manager: UserManager, username: str) -> Optional[str]:
+    """Return the ID of the user with the given username (case-insensitive)."""
+    lowered = username.lower()
+    for user_id, name in user_manager.iter_usernames():
+        if name.lower() == lowered:
+            return user_id
 
     return None
 
@@ -63,10 +58,9 @@ def add_new_user(user_manager: UserManager, args):
     username = args.username or input("Enter username: ")
 
     # Check if username already exists
-    for user in user_manager.list_users():
-        if user.username.lower() == username.lower():
-            print(f"Error: User '{username}' already exists.")
-            return False
+    if find_user_id(user_manager, username):
+        print(f"Error: User '{username}' already exists.")
+        return False
 
     email = args.email or input("Enter email (optional): ")
     is_admin = args.admin or input("Make user admin? (y/N): ").lower() == "y"
@@ -99,13 +93,8 @@ def reset_user_password(user_manager: UserManager, args):
     username = args.username or input("Enter username: ")
 
     # Find user
-    user = None
-    for u in user_manager.list_users():
-        if u.username.lower() == username.lower():
-            user = u
-            break
-
-    if not user:
+    user_id = find_user_id(user_manager, username)
+    if not user_id:
         print(f"Error: User '{username}' not found.")
         return False
 
@@ -122,7 +111,7 @@ def reset_user_password(user_manager: UserManager, args):
             return False
 
     # Change password
-    if change_password(user.user_id, password):
+    if change_password(user_id, password):
         print(f"Password for user '{username}' reset successfully.")
         return True
     else:
@@ -135,13 +124,8 @@ def delete_existing_user(user_manager: UserManager, args):
     username = args.username or input("Enter username: ")
 
     # Find user
-    user = None
-    for u in user_manager.list_users():
-        if u.username.lower() == username.lower():
-            user = u
-            break
-
-    if not user:
+    user_id = find_user_id(user_manager, username)
+    if not user_id:
         print(f"Error: User '{username}' not found.")
         return False
 
@@ -155,7 +139,7 @@ def delete_existing_user(user_manager: UserManager, args):
             return False
 
     # Delete user
-    if user_manager.delete_user(user.user_id):
+    if user_manager.delete_user(user_id):
         print(f"User '{username}' deleted successfully.")
         return True
     else:
@@ -199,7 +183,7 @@ def main():
         return 1
 
     # Find users file
-    users_file = args.users_file or find_users_file()
+    users_file = args.users_file or resolve_users_file()
     if not users_file:
         print("Error: Could not find users.json file. Please specify with --users-file.")
         return 1
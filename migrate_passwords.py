@@ -1,11 +1,10 @@
 #!/usr/bin/env python3
-"""Script to migrate plaintext passwords to secure bcrypt hashes."""
+"""Script to migrate plaintext passwords to secure argon2id hashes."""
 
 import logging
-import os
 import sys
 
-from github_activity_tracker.web.auth.user_manager import UserManager
+from github_activity_tracker.web.auth.user_manager import UserManager, resolve_users_file
 
 # Set up logging
 logging.basicConfig(
@@ -23,17 +22,7 @@ def main():
         users_file = sys.argv[1]
     else:
         # Try to find users.json in the default locations
-        possible_paths = [
-            os.path.join("github_activity_tracker", "data", "users.json"),
-            os.path.join("data", "users.json"),
-            "users.json",
-        ]
-
-        users_file = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                users_file = path
-                break
+        users_file = resolve_users_file()
 
         if not users_file:
             logger.error("Could not find users.json file. Please specify the path as argument.")
@@ -6,17 +6,18 @@ This script starts the application with enhanced debugging
 options enabled for easier troubleshooting.
 """
 
+import argparse
 import logging
 import os
 import secrets
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Import app creator after configuring environment
 from github_activity_tracker.utils import set_debug_mode
-from github_activity_tracker.web import create_app
 
 # Add the project root to the Python path to ensure modules can be found
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -27,11 +28,31 @@ if project_root not in sys.path:
 os.environ["DEBUG"] = "true"
 os.environ["FLASK_DEBUG"] = "true"
 
+parser = argparse.ArgumentParser(description="Run the GitHub Activity Tracker in debug mode")
+parser.add_argument(
+    "--reload",
+    action="store_true",
+    help="Restart the server when source files change (or set RELOAD=true)",
+)
+args = parser.parse_args()
+
+# The reloader is opt-in: it restarts the whole process on every file change,
+# re-importing every dependency and killing in-flight job threads
+use_reloader = args.reload or os.getenv("RELOAD", "false").lower() == "true"
+
+# With the reloader on, this script runs twice: in a watcher process and in the
+# serving child (WERKZEUG_RUN_MAIN=true). One-time setup only runs in the latter.
+is_serving_process = not use_reloader or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+
 # Configure enhanced logging
+log_handlers = [logging.StreamHandler(sys.stdout)]
+if is_serving_process:
+    log_handlers.append(logging.FileHandler("debug.log", mode="w"))
+
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout), logging.FileHandler("debug.log", mode="w")],
+    handlers=log_handlers,
 )
 
 logger = logging.getLogger("debug_launcher")
@@ -46,96 +67,82 @@ set_debug_mode(True)
 logger.info("Debug mode enabled")
 
 # Ensure data directory exists
-data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-Path(data_dir).mkdir(parents=True, exist_ok=True)
-logger.info(f"Ensured data directory exists: {data_dir}")
+if is_serving_process:
+    data_dir_path = Path(__file__).resolve().parent / "data"
+    if not data_dir_path.is_dir():
+        data_dir_path.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Created data directory: {data_dir_path}")
 
 # Set a debug secret key if not already set
 if not os.getenv("SECRET_KEY"):
-    secret_key = secrets.token_hex(24)
+    secret_key = secrets.token_urlsafe(32)
     os.environ["SECRET_KEY"] = secret_key
     logger.info("Generated debug secret key")
 
-# Create the Flask application with additional debug configuration
-logger.info("Creating Flask application in debug mode...")
-app = create_app()
+# Environment shown by the debug console; it does not change after startup
+DEBUG_ENV = {k: v for k, v in os.environ.items() if k.startswith(("GITHUB_", "DEBUG", "FLASK"))}
+
+# Jobs shown by the debug console, reloaded from disk at most once per TTL
+JOBS_CACHE_TTL = 1.0
+_jobs_cache = {"loaded_at": 0.0, "jobs": None}
+
+
+def get_cached_jobs():
+    """Return the stored jobs, re-reading the jobs file only when the cache is stale."""
+    from github_activity_tracker.utils.job_storage import debug_jobs_file, load_jobs
+
+    now = time.monotonic()
+    if _jobs_cache["jobs"] is None or now - _jobs_cache["loaded_at"] > JOBS_CACHE_TTL:
+        debug_jobs_file()
+        _jobs_cache.update(jobs=load_jobs(), loaded_at=now)
+
+    return _jobs_cache["jobs"]
 
 
-# Add additional debug-only routes
-@app.route("/debug-console")
 def debug_console():
     """Debug console to examine application state."""
-    from github_activity_tracker.utils.job_storage import debug_jobs_file, load_jobs
+    from flask import Response, request, stream_template
 
     # Get job information
-    debug_jobs_file()
-    jobs = load_jobs()
-
-    # Generate job summary
-    job_summary = [
-        f"<strong>Job ID:</strong> {job_id}<br>"
-        f"<strong>Status:</strong> {job.get('status', 'unknown')}<br>"
-        f"<strong>Users:</strong> {job.get('total_users', 0)}<br>"
-        f"<strong>Start:</strong> {job.get('start_time', 'N/A')}<br>"
-        f"<hr>"
-        for job_id, job in jobs.items()
-    ]
-
-    # Generate debug information
+    jobs = get_cached_jobs()
+
+    # Generate debug information; listing modules is opt-in via ?modules=1
     debug_info = {
-        "Environment": {
-            k: v for k, v in os.environ.items() if k.startswith(("GITHUB_", "DEBUG", "FLASK"))
-        },
+        "Environment": DEBUG_ENV,
         "Job Count": len(jobs),
-        "Modules": list(sys.modules.keys()),
+        "Modules": list(sys.modules) if request.args.get("modules") else len(sys.modules),
         "Python Path": sys.path,
     }
 
-    debug_html = "<h2>Debug Information</h2>"
-    for section, data in debug_info.items():
-        debug_html += f"<h3>{section}</h3>"
-        debug_html += "<pre>"
-        if isinstance(data, dict):
-            for k, v in data.items():
-                debug_html += f"{k}: {v}\n"
-        elif isinstance(data, list):
-            debug_html += "\n".join(data[:100]) + ("..." if len(data) > 100 else "")
-        else:
-            debug_html += str(data)
-        debug_html += "</pre>"
-
-    return f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Debug Console</title>
-        <style>
-            body {{ font-family: monospace; padding: 20px; }}
-            h1, h2, h3 {{ color: #0366d6; }}
-            pre {{ background: #f6f8fa; padding: 15px; border-radius: 5px; overflow: auto; }}
-            .jobs {{ display: flex; flex-wrap: wrap; gap: 10px; }}
-            .job-card {{ border: 1px solid #e1e4e8; border-radius: 5px; padding: 10px; width: 300px; }}
-        </style>
-    </head>
-    <body>
-        <h1>GitHub Activity Tracker Debug Console</h1>
-
-        <h2>Jobs ({len(jobs)})</h2>
-        <div class="jobs">
-            {"".join([f'<div class="job-card">{summary}</div>' for summary in job_summary])}
-        </div>
-
-        {debug_html}
-
-        <div style="margin-top: 20px">
-            <a href="/" style="color: #0366d6">Back to Application</a>
-        </div>
-    </body>
-    </html>
-    """  # noqa: E501
+    return Response(
+        stream_template("debug_console.html", jobs=jobs, debug_info=debug_info),
+        mimetype="text/html",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_app():
+    """Create the Flask application with the debug-only routes.
+
+    The web package pulls in Flask and the tracker's dependencies, so it is
+    imported on first call rather than when this script is loaded.
+    """
+    # Import app creator after configuring environment
+    from github_activity_tracker.web import create_app
+
+    # Create the Flask application with additional debug configuration
+    logger.info("Creating Flask application in debug mode...")
+    app = create_app()
+
+    # Add additional debug-only routes
+    app.add_url_rule("/debug-console", view_func=debug_console)
+
+    return app
 
 
 if __name__ == "__main__":
+    app = get_app()
+
     # Run with enhanced debug settings
     host = os.getenv("HOST", "127.0.0.1")
     port = int(os.getenv("PORT", 5000))
@@ -143,4 +150,11 @@ if __name__ == "__main__":
     logger.info(f"Starting server on http://{host}:{port} with DEBUG=True")
     logger.info("Visit /debug-console to access the debug interface")
 
-    app.run(host=host, port=port, debug=True, use_reloader=True, use_debugger=True, threaded=True)
+    app.run(
+        host=host,
+        port=port,
+        debug=True,
+        use_reloader=use_reloader,
+        use_debugger=True,
+        threaded=True,
+    )
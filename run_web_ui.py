@@ -16,10 +16,6 @@ from dotenv import load_dotenv
 
 from github_activity_tracker.utils import set_debug_mode
 from github_activity_tracker.utils.logging_config import logger
-from github_activity_tracker.utils.werkzeug_logging import init_werkzeug_logging
-
-# Import web app after utils to ensure all dependencies are loaded
-from github_activity_tracker.web import create_app
 
 # Add the project root to the Python path to ensure modules can be found
 project_root = os.path.dirname(os.path.abspath(__file__))
@@ -39,44 +35,54 @@ if os.getenv("DEBUG", "false").lower() == "true":
     set_debug_mode()
 
 # Ensure data directory exists
-data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-Path(data_dir).mkdir(parents=True, exist_ok=True)
+data_dir_path = Path(__file__).resolve().parent / "data"
+if not data_dir_path.is_dir():
+    data_dir_path.mkdir(parents=True, exist_ok=True)
 
 # Generate a secret key for the app if not already set in environment
 if not os.getenv("SECRET_KEY"):
-    secret_key = secrets.token_hex(24)
+    secret_key = secrets.token_urlsafe(32)
     os.environ["SECRET_KEY"] = secret_key
 
     # Add to .env file if possible
     env_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
-    if os.path.exists(env_file):
-        try:
-            with open(env_file, "r") as f:
-                env_lines = f.readlines()
+    try:
+        # Single read-modify-write; a missing .env is left alone
+        with open(env_file, "r+") as f:
+            env_lines = f.read().splitlines()
 
             # Check if SECRET_KEY is already in .env
-            has_secret_key = any(line.startswith("SECRET_KEY=") for line in env_lines)
-
-            if not has_secret_key:
-                with open(env_file, "a") as f:
-                    f.write(
-                        f"\n# Auto-generated secret key for Flask sessions"
-                        f"\nSECRET_KEY={secret_key}\n"
-                    )
-        except Exception as e:
-            logging.warning(f"Could not update .env file with secret key: {e}")
-
-# Create the Flask application
-try:
-    print("Creating Flask application...")
-    app = create_app()
-    print("Flask application created successfully")
-except Exception as e:
-    import traceback
-
-    print(f"ERROR: Failed to create Flask application: {e}")
-    traceback.print_exc()
-    sys.exit(1)
+            if not any(line.startswith("SECRET_KEY=") for line in env_lines):
+                f.write(
+                    f"\n# Auto-generated secret key for Flask sessions\nSECRET_KEY={secret_key}\n"
+                )
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.warning(f"Could not update .env file with secret key: {e}")
+
+
+def create_web_app():
+    """Create the Flask application, exiting if it cannot be created.
+
+    The web package pulls in Flask and the tracker's dependencies, so it is
+    only imported once the command line has been parsed.
+    """
+    try:
+        # Import web app after utils to ensure all dependencies are loaded
+        from github_activity_tracker.web import create_app
+
+        print("Creating Flask application...")
+        app = create_app()
+        print("Flask application created successfully")
+        return app
+    except Exception as e:
+        import traceback
+
+        print(f"ERROR: Failed to create Flask application: {e}")
+        traceback.print_exc()
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     try:
@@ -96,6 +102,9 @@ if __name__ == "__main__":
         )
         args = parser.parse_args()
 
+        # Create the Flask application
+        app = create_web_app()
+
         # Get port from args or environment
         port = args.port
 
@@ -123,11 +132,24 @@ if __name__ == "__main__":
         print(f"Debug mode: {debug_mode}")
 
         # Initialize custom Werkzeug logging handler
+        from github_activity_tracker.utils.werkzeug_logging import init_werkzeug_logging
+
         logger.info("Initializing custom Werkzeug logging")
         custom_request_handler = init_werkzeug_logging()
 
-        # Run the Flask app with custom request handler
-        app.run(host=host, port=port, debug=debug_mode, request_handler=custom_request_handler)
+        # Run the Flask app with custom request handler, one thread per request so a
+        # slow tracking request does not block status polls and static assets.
+        # Werkzeug's processes=N mode is not an option: tracking jobs run on
+        # background threads of the process that accepted the request, and job
+        # state lives in that process's memory, so a forked request process exiting
+        # would kill its job. Use a multi-worker WSGI server for more throughput.
+        app.run(
+            host=host,
+            port=port,
+            debug=debug_mode,
+            threaded=True,
+            request_handler=custom_request_handler,
+        )
     except Exception as e:
         import traceback
 
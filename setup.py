@@ -11,10 +11,14 @@ setup(
     install_requires=[
         "pygithub",
         "pandas",
-        "matplotlib",
         "python-dotenv",
         "jinja2",
     ],
+    extras_require={
+        "web": ["flask", "flask-session", "jinja2", "bcrypt", "argon2-cffi"],
+        "viz": ["matplotlib"],
+        "all": ["flask", "flask-session", "jinja2", "bcrypt", "argon2-cffi", "matplotlib"],
+    },
     entry_points={
         "console_scripts": [
             "github-activity-tracker=github_activity_tracker.cli:main",
@@ -1,37 +1,79 @@
 """Shared fixtures for tests."""
 
-import os
-import tempfile
+import itertools
+from types import SimpleNamespace
 
 import pytest
 
 
 @pytest.fixture
-def mock_env_variables():
+def mock_env_variables(monkeypatch):
     """Mock environment variables for testing."""
-    original_env = os.environ.copy()
+    monkeypatch.setenv("GITHUB_TOKEN", "test_token")
+    monkeypatch.setenv("GITHUB_ORG", "test-org")
+    monkeypatch.setenv("GITHUB_USERS", "user1,user2,user3")
 
-    # Set test environment variables
-    os.environ["GITHUB_TOKEN"] = "test_token"
-    os.environ["GITHUB_ORG"] = "test-org"
-    os.environ["GITHUB_USERS"] = "user1,user2,user3"
 
-    yield
+@pytest.fixture
+def temp_users_file(tmp_path):
+    """Create a temporary users file for testing."""
+    users_file = tmp_path / "users.txt"
+    users_file.write_text("user1\nuser2\nuser3\n")
+    return str(users_file)
 
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
 
+@pytest.fixture(scope="session")
+def users_file_factory(tmp_path_factory):
+    """Return a function that writes a users file and returns its path."""
+    users_dir = tmp_path_factory.mktemp("users")
+    counter = itertools.count()
 
-@pytest.fixture
-def temp_users_file():
-    """Create a temporary users file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp:
-        temp.write("user1\nuser2\nuser3\n")
-        temp_name = temp.name
+    def _make_users_file(content):
+        users_file = users_dir / f"users_{next(counter)}.txt"
+        users_file.write_text(content)
+        return str(users_file)
+
+    return _make_users_file
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit_thread(monkeypatch):
+    """Stop GitHubActivityTracker from starting its background rate limit thread."""
+
+    class NoopThread:
+        """Stand-in for threading.Thread that never runs its target."""
 
-    yield temp_name
+        daemon = True
 
-    # Clean up
-    if os.path.exists(temp_name):
-        os.unlink(temp_name)
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def start(self):
+            pass
+
+        def is_alive(self):
+            return False
+
+    # Swap the module's threading reference, not threading.Thread itself, so other code
+    # and pytest plugins keep real threads
+    monkeypatch.setattr(
+        "github_activity_tracker.api.github_client.threading", SimpleNamespace(Thread=NoopThread)
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def matplotlib_agg():
+    """Select the non-interactive Agg backend once for the whole session."""
+    try:
+        import matplotlib
+    except ImportError:
+        yield
+        return
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    # Plot tests patch plt.close, so their figures stay open until the session ends
+    plt.rcParams["figure.max_open_warning"] = 0
+    yield
+    plt.close("all")
@@ -1,6 +1,8 @@
 """Tests for the GitHub client module."""
 
-from datetime import datetime, timezone
+import logging
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,32 +10,87 @@ from github import GithubException, RateLimitExceededException
 
 from github_activity_tracker.api.github_client import GitHubActivityTracker
 
+# Tracking window shared by the track_user_activities tests
+START_DATE = datetime(2023, 1, 1, tzinfo=timezone.utc)
+END_DATE = datetime(2023, 1, 31, tzinfo=timezone.utc)
 
-@pytest.fixture
-def mock_github():
-    """Fixture for a mocked GitHub API client."""
-    with patch("github_activity_tracker.api.github_client.Github") as mock_github:
-        # Mock rate limit
-        rate_limit = MagicMock()
-        core_limit = MagicMock()
-        core_limit.limit = 5000
-        core_limit.remaining = 4000
-        core_limit.reset.timestamp.return_value = datetime.now().timestamp() + 3600
+# Activity dates and expected column order for test_get_data_frame
+JAN_15 = datetime(2023, 1, 15)
+JAN_20 = datetime(2023, 1, 20)
+DATA_FRAME_COLUMNS = ("user", "date", "type", "repo", "id", "url")
+
+
+def make_rate_limit():
+    """Build a rate limit response from plain namespaces instead of a MagicMock tree.
+
+    A fresh object is built per test because some tests lower the counters in place. The reset
+    time is a real datetime, which already provides the timestamp() the client calls.
+    """
+    reset = datetime.now() + timedelta(hours=1)
+    return SimpleNamespace(
+        core=SimpleNamespace(limit=5000, remaining=4000, reset=reset),
+        search=SimpleNamespace(limit=30, remaining=25, reset=reset),
+    )
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger(caplog):
+    """Silence the tracker's logger for tests that do not patch it."""
+    caplog.set_level(logging.CRITICAL, logger="github_activity_tracker")
 
-        search_limit = MagicMock()
-        search_limit.limit = 30
-        search_limit.remaining = 25
-        search_limit.reset.timestamp.return_value = datetime.now().timestamp() + 3600
 
-        rate_limit.core = core_limit
-        rate_limit.search = search_limit
+def make_pr(repo, **fields):
+    """Build a search result item as a plain namespace; tests only read its attributes."""
+    fields.setdefault("pull_request", True)
+    return SimpleNamespace(repository=SimpleNamespace(full_name=repo), **fields)
 
-        mock_github.return_value.get_rate_limit.return_value = rate_limit
 
-        # Return the mock
+@pytest.fixture(scope="module")
+def github_patch():
+    """Patch the Github class once for the whole module."""
+    with patch("github_activity_tracker.api.github_client.Github") as mock_github:
         yield mock_github
 
 
+@pytest.fixture
+def mock_github(github_patch):
+    """Fixture for a mocked GitHub API client, reset before each test."""
+    github_patch.reset_mock()
+    # Clear return values and side effects configured by the previous test
+    github_patch.return_value.reset_mock(return_value=True, side_effect=True)
+
+    # Mock rate limit
+    github_patch.return_value.get_rate_limit.return_value = make_rate_limit()
+
+    return github_patch
+
+
+@pytest.fixture(scope="module")
+def tracker_cache():
+    """Trackers built for this module, keyed by constructor kwargs."""
+    return {}
+
+
+@pytest.fixture
+def make_tracker(mock_github, tracker_cache):
+    """Factory returning a tracker with no activities and a reset Github mock.
+
+    Trackers are reused across tests with the same kwargs; the Github instance mock they hold
+    is shared too, so only call history needs clearing.
+    """
+
+    def _make_tracker(**kwargs):
+        key = frozenset(kwargs.items())
+        tracker = tracker_cache.get(key)
+        if tracker is None:
+            tracker = tracker_cache[key] = GitHubActivityTracker("fake_token", **kwargs)
+        tracker.activities = []
+        mock_github.reset_mock()
+        return tracker
+
+    return _make_tracker
+
+
 def test_init(mock_github):
     """Test initializing the tracker."""
     tracker = GitHubActivityTracker("fake_token", org="test-org")
@@ -62,12 +119,9 @@ def test_rate_limit_monitor(mock_thread, mock_github):
     mock_thread.return_value.start.assert_called_once()
 
 
-def test_check_rate_limit(mock_github):
+def test_check_rate_limit(mock_github, make_tracker):
     """Test checking rate limits."""
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
-
-    # Reset mock to clear initialization calls
-    mock_github.reset_mock()
+    tracker = make_tracker(monitor_rate_limit=False)
 
     # Call the method
     result = tracker._check_rate_limit()
@@ -80,7 +134,7 @@ def test_check_rate_limit(mock_github):
 
 
 @patch("github_activity_tracker.api.github_client.logger")
-def test_check_rate_limit_low_warning(mock_logger, mock_github):
+def test_check_rate_limit_low_warning(mock_logger, mock_github, make_tracker):
     """Test rate limit warning when running low."""
     # Set up rate limit to be low
     rate_limit = mock_github.return_value.get_rate_limit.return_value
@@ -90,10 +144,9 @@ def test_check_rate_limit_low_warning(mock_logger, mock_github):
     rate_limit.search.remaining = 25
 
     # Create tracker
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
+    tracker = make_tracker(monitor_rate_limit=False)
 
-    # Reset mocks
-    mock_github.reset_mock()
+    # Reset logger mock
     mock_logger.reset_mock()
 
     # Call method
@@ -110,7 +163,7 @@ def test_check_rate_limit_low_warning(mock_logger, mock_github):
 
 
 @patch("github_activity_tracker.api.github_client.logger")
-def test_check_rate_limit_critical_warning(mock_logger, mock_github):
+def test_check_rate_limit_critical_warning(mock_logger, mock_github, make_tracker):
     """Test rate limit critical warning when almost depleted."""
     # Set up rate limit to be critically low
     rate_limit = mock_github.return_value.get_rate_limit.return_value
@@ -120,10 +173,9 @@ def test_check_rate_limit_critical_warning(mock_logger, mock_github):
     rate_limit.search.remaining = 1  # 3.3% remaining
 
     # Create tracker
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
+    tracker = make_tracker(monitor_rate_limit=False)
 
-    # Reset mocks
-    mock_github.reset_mock()
+    # Reset logger mock
     mock_logger.reset_mock()
 
     # Call method
@@ -145,16 +197,15 @@ def test_check_rate_limit_critical_warning(mock_logger, mock_github):
 
 
 @patch("github_activity_tracker.api.github_client.logger")
-def test_check_rate_limit_error(mock_logger, mock_github):
+def test_check_rate_limit_error(mock_logger, mock_github, make_tracker):
     """Test rate limit check with error."""
     # Configure get_rate_limit to raise an exception
     mock_github.return_value.get_rate_limit.side_effect = GithubException(500, "Test error")
 
     # Create tracker
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
+    tracker = make_tracker(monitor_rate_limit=False)
 
-    # Reset mocks
-    mock_github.reset_mock()
+    # Reset logger mock
     mock_logger.reset_mock()
 
     # Call method
@@ -167,8 +218,7 @@ def test_check_rate_limit_error(mock_logger, mock_github):
     assert result is False
 
 
-@patch("github_activity_tracker.api.github_client.logger")
-def test_track_user_activities_empty(mock_logger, mock_github):
+def test_track_user_activities_empty(mock_github, make_tracker):
     """Test tracking activities with empty responses."""
     # Mock user
     mock_user = MagicMock()
@@ -182,11 +232,9 @@ def test_track_user_activities_empty(mock_logger, mock_github):
     mock_github.return_value.search_issues.return_value = []
 
     # Create tracker and track activities
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
-    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
+    tracker = make_tracker(monitor_rate_limit=False)
 
-    activities = tracker.track_user_activities("test_user", start_date, end_date)
+    activities = tracker.track_user_activities("test_user", START_DATE, END_DATE)
 
     # Verify user was fetched
     mock_github.return_value.get_user.assert_called_once_with("test_user")
@@ -200,8 +248,7 @@ def test_track_user_activities_empty(mock_logger, mock_github):
     assert len(tracker.activities) == 0
 
 
-@patch("github_activity_tracker.api.github_client.logger")
-def test_track_user_activities_with_data(mock_logger, mock_github):
+def test_track_user_activities_with_data(mock_github, make_tracker):
     """Test tracking activities with PRs and reviews."""
     # Mock user
     mock_user = MagicMock()
@@ -211,56 +258,48 @@ def test_track_user_activities_with_data(mock_logger, mock_github):
     mock_user.public_repos = 10
 
     # Mock PR data
-    pr1 = MagicMock()
-    pr1.id = 101
-    pr1.number = 42
-    pr1.title = "Test PR 1"
-    pr1.state = "open"
-    pr1.created_at = datetime(2023, 1, 15, tzinfo=timezone.utc)
-    pr1.comments = 3
-    pr1.pull_request = True  # Flag to identify it as a PR
-    pr1.repository = MagicMock()
-    pr1.repository.full_name = "test-org/test-repo-1"
-
-    pr2 = MagicMock()
-    pr2.id = 102
-    pr2.number = 43
-    pr2.title = "Test PR 2"
-    pr2.state = "closed"
-    pr2.created_at = datetime(2023, 1, 20, tzinfo=timezone.utc)
-    pr2.comments = 0
-    pr2.pull_request = True
-    pr2.repository = MagicMock()
-    pr2.repository.full_name = "test-org/test-repo-2"
+    pr1 = make_pr(
+        "test-org/test-repo-1",
+        id=101,
+        number=42,
+        title="Test PR 1",
+        state="open",
+        created_at=datetime(2023, 1, 15, tzinfo=timezone.utc),
+        comments=3,
+    )
+    pr2 = make_pr(
+        "test-org/test-repo-2",
+        id=102,
+        number=43,
+        title="Test PR 2",
+        state="closed",
+        created_at=datetime(2023, 1, 20, tzinfo=timezone.utc),
+        comments=0,
+    )
 
     # Non-PR issue that should be skipped
-    issue = MagicMock()
-    issue.pull_request = None
-    issue.repository = MagicMock()
-    issue.repository.full_name = "test-org/test-repo-1"
+    issue = make_pr("test-org/test-repo-1", number=46, pull_request=None)
 
     # PR from a different org that should be skipped when filtering by org
-    pr_other_org = MagicMock()
-    pr_other_org.id = 103
-    pr_other_org.number = 44
-    pr_other_org.title = "Test PR Other Org"
-    pr_other_org.state = "open"
-    pr_other_org.created_at = datetime(2023, 1, 25, tzinfo=timezone.utc)
-    pr_other_org.comments = 1
-    pr_other_org.pull_request = True
-    pr_other_org.repository = MagicMock()
-    pr_other_org.repository.full_name = "other-org/test-repo"
+    pr_other_org = make_pr(
+        "other-org/test-repo",
+        id=103,
+        number=44,
+        title="Test PR Other Org",
+        state="open",
+        created_at=datetime(2023, 1, 25, tzinfo=timezone.utc),
+        comments=1,
+    )
 
     # Mock review data
-    review1 = MagicMock()
-    review1.id = 201
-    review1.number = 45
-    review1.title = "Review PR 1"
-    review1.state = "closed"
-    review1.updated_at = datetime(2023, 1, 18, tzinfo=timezone.utc)
-    review1.pull_request = True
-    review1.repository = MagicMock()
-    review1.repository.full_name = "test-org/test-repo-3"
+    review1 = make_pr(
+        "test-org/test-repo-3",
+        id=201,
+        number=45,
+        title="Review PR 1",
+        state="closed",
+        updated_at=datetime(2023, 1, 18, tzinfo=timezone.utc),
+    )
 
     # Mock API calls
     mock_github.return_value.get_user.return_value = mock_user
@@ -276,11 +315,9 @@ def test_track_user_activities_with_data(mock_logger, mock_github):
     )
 
     # Create tracker and track activities with org filter
-    tracker = GitHubActivityTracker("fake_token", org="test-org", monitor_rate_limit=False)
-    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
+    tracker = make_tracker(org="test-org", monitor_rate_limit=False)
 
-    activities = tracker.track_user_activities("test_user", start_date, end_date)
+    activities = tracker.track_user_activities("test_user", START_DATE, END_DATE)
 
     # Verify user was fetched
     mock_github.return_value.get_user.assert_called_once_with("test_user")
@@ -304,24 +341,22 @@ def test_track_user_activities_with_data(mock_logger, mock_github):
     assert len(tracker.activities) == 3
 
 
-@patch("github_activity_tracker.api.github_client.logger")
-def test_track_user_activities_no_org_filter(mock_logger, mock_github):
+def test_track_user_activities_no_org_filter(mock_github, make_tracker):
     """Test tracking activities without org filter."""
     # Mock user
     mock_user = MagicMock()
     mock_user.name = "Test User"
 
     # Mock PR from a different org that should be included when not filtering
-    pr_other_org = MagicMock()
-    pr_other_org.id = 103
-    pr_other_org.number = 44
-    pr_other_org.title = "Test PR Other Org"
-    pr_other_org.state = "open"
-    pr_other_org.created_at = datetime(2023, 1, 25, tzinfo=timezone.utc)
-    pr_other_org.comments = 1
-    pr_other_org.pull_request = True
-    pr_other_org.repository = MagicMock()
-    pr_other_org.repository.full_name = "other-org/test-repo"
+    pr_other_org = make_pr(
+        "other-org/test-repo",
+        id=103,
+        number=44,
+        title="Test PR Other Org",
+        state="open",
+        created_at=datetime(2023, 1, 25, tzinfo=timezone.utc),
+        comments=1,
+    )
 
     # Mock API calls
     mock_github.return_value.get_user.return_value = mock_user
@@ -333,11 +368,9 @@ def test_track_user_activities_no_org_filter(mock_logger, mock_github):
     ]
 
     # Create tracker WITHOUT org filter
-    tracker = GitHubActivityTracker("fake_token", org=None, monitor_rate_limit=False)
-    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
+    tracker = make_tracker(org=None, monitor_rate_limit=False)
 
-    activities = tracker.track_user_activities("test_user", start_date, end_date)
+    activities = tracker.track_user_activities("test_user", START_DATE, END_DATE)
 
     # Verify results should include the PR from other-org
     assert len(activities) == 1
@@ -345,7 +378,7 @@ def test_track_user_activities_no_org_filter(mock_logger, mock_github):
 
 
 @patch("github_activity_tracker.api.github_client.logger")
-def test_track_user_activities_with_rate_limit_exception(mock_logger, mock_github):
+def test_track_user_activities_with_rate_limit_exception(mock_logger, mock_github, make_tracker):
     """Test tracking activities with rate limit exception."""
     # Mock user
     mock_user = MagicMock()
@@ -366,12 +399,10 @@ def test_track_user_activities_with_rate_limit_exception(mock_logger, mock_githu
     ]
 
     # Create tracker
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
-    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
+    tracker = make_tracker(monitor_rate_limit=False)
 
     # Should continue despite rate limit exception
-    activities = tracker.track_user_activities("test_user", start_date, end_date)
+    activities = tracker.track_user_activities("test_user", START_DATE, END_DATE)
 
     # Verify warning was logged
     mock_logger.error.assert_called()
@@ -393,18 +424,16 @@ def test_track_user_activities_with_rate_limit_exception(mock_logger, mock_githu
 
 
 @patch("github_activity_tracker.api.github_client.logger")
-def test_track_user_activities_with_github_exception(mock_logger, mock_github):
+def test_track_user_activities_with_github_exception(mock_logger, mock_github, make_tracker):
     """Test tracking activities with GitHub exception."""
     # Configure get_user to raise exception
     mock_github.return_value.get_user.side_effect = GithubException(404, "User not found")
 
     # Create tracker
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
-    start_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
-    end_date = datetime(2023, 1, 31, tzinfo=timezone.utc)
+    tracker = make_tracker(monitor_rate_limit=False)
 
     # Should handle the exception gracefully
-    activities = tracker.track_user_activities("nonexistent_user", start_date, end_date)
+    activities = tracker.track_user_activities("nonexistent_user", START_DATE, END_DATE)
 
     # Verify error was logged
     mock_logger.error.assert_called()
@@ -416,16 +445,16 @@ def test_track_user_activities_with_github_exception(mock_logger, mock_github):
     assert len(activities) == 0
 
 
-def test_get_data_frame(mock_github):
+def test_get_data_frame(make_tracker):
     """Test converting activities to DataFrame."""
     # Create tracker
-    tracker = GitHubActivityTracker("fake_token", monitor_rate_limit=False)
+    tracker = make_tracker(monitor_rate_limit=False)
 
     # Add sample activities
     sample_activities = [
         {
             "user": "user1",
-            "date": datetime(2023, 1, 15),
+            "date": JAN_15,
             "type": "PullRequestEvent",
             "repo": "org/repo1",
             "id": "1",
@@ -433,7 +462,7 @@ def test_get_data_frame(mock_github):
         },
         {
             "user": "user1",
-            "date": datetime(2023, 1, 20),
+            "date": JAN_20,
             "type": "PullRequestReviewEvent",
             "repo": "org/repo2",
             "id": "2",
@@ -448,8 +477,8 @@ def test_get_data_frame(mock_github):
     # Verify DataFrame
     assert df is not None
     assert len(df) == 2
-    assert list(df.columns) == ["user", "date", "type", "repo", "id", "url"]
+    assert tuple(df.columns) == DATA_FRAME_COLUMNS
 
     # Verify sorted by date
-    assert df.iloc[0]["date"] == datetime(2023, 1, 20)
-    assert df.iloc[1]["date"] == datetime(2023, 1, 15)
+    assert df.iloc[0]["date"] == JAN_20
+    assert df.iloc[1]["date"] == JAN_15
@@ -4,45 +4,42 @@ import logging
 import unittest
 from unittest.mock import Mock, patch
 
+import pytest
+
 from github_activity_tracker.utils.logger_utils import (
     LevelOffsetLogger,
     configure_github_retry_logger,
 )
 
+# Logger attribute names, computed once; a list spec skips re-introspecting the class per mock
+LOGGER_SPEC = dir(logging.Logger)
+
+
+@pytest.mark.parametrize(
+    "method, expected_level",
+    [
+        ("debug", logging.INFO),
+        ("info", logging.WARNING),
+        ("warning", logging.ERROR),
+        ("error", logging.CRITICAL),
+        ("critical", logging.CRITICAL),
+    ],
+)
+def test_level_offset(method, expected_level):
+    """Test each level method logs one level higher, capped at CRITICAL."""
+    mock_logger = Mock(spec=LOGGER_SPEC)
+    getattr(LevelOffsetLogger(mock_logger), method)("test message")
+    mock_logger.log.assert_called_once_with(expected_level, "test message")
+
 
 class TestLevelOffsetLogger(unittest.TestCase):
     """Tests for the LevelOffsetLogger adapter."""
 
     def setUp(self):
         # Create a mock logger for testing
-        self.mock_logger = Mock(spec=logging.Logger)
+        self.mock_logger = Mock(spec=LOGGER_SPEC)
         self.offset_logger = LevelOffsetLogger(self.mock_logger)
 
-    def test_debug_to_info(self):
-        """Test DEBUG message is logged at INFO level."""
-        self.offset_logger.debug("test message")
-        self.mock_logger.log.assert_called_once_with(logging.INFO, "test message")
-
-    def test_info_to_warning(self):
-        """Test INFO message is logged at WARNING level."""
-        self.offset_logger.info("test message")
-        self.mock_logger.log.assert_called_once_with(logging.WARNING, "test message")
-
-    def test_warning_to_error(self):
-        """Test WARNING message is logged at ERROR level."""
-        self.offset_logger.warning("test message")
-        self.mock_logger.log.assert_called_once_with(logging.ERROR, "test message")
-
-    def test_error_to_critical(self):
-        """Test ERROR message is logged at CRITICAL level."""
-        self.offset_logger.error("test message")
-        self.mock_logger.log.assert_called_once_with(logging.CRITICAL, "test message")
-
-    def test_critical_remains_critical(self):
-        """Test CRITICAL message remains at CRITICAL level."""
-        self.offset_logger.critical("test message")
-        self.mock_logger.log.assert_called_once_with(logging.CRITICAL, "test message")
-
     def test_log_method_with_offset(self):
         """Test the generic log method applies the level offset."""
         self.offset_logger.log(logging.DEBUG, "test message")
@@ -75,7 +72,7 @@ class TestConfigureGithubRetryLogger(unittest.TestCase):
         # Create a mock GithubRetry instance
         mock_github_retry = Mock()
         # Mock getattr to control access to _GithubRetry__logger
-        mock_logger = Mock(spec=logging.Logger)
+        mock_logger = Mock(spec=LOGGER_SPEC)
 
         # Call the function
         configure_github_retry_logger(mock_github_retry, mock_logger)
@@ -99,7 +96,7 @@ class TestConfigureGithubRetryLogger(unittest.TestCase):
         # Make sure setting the attribute raises AttributeError
         type(mock_github_retry).__setattr__ = Mock(side_effect=AttributeError)
 
-        mock_logger = Mock(spec=logging.Logger)
+        mock_logger = Mock(spec=LOGGER_SPEC)
 
         # Call the function - it should handle the exception
         with patch("github_activity_tracker.utils.logger_utils.LevelOffsetLogger") as _:
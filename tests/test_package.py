@@ -1,6 +1,18 @@
 """Tests for package structure and imports."""
 
 import importlib.util
+import os
+import pkgutil
+
+
+def _walk_module_names(path, prefix):
+    """Yield every module name below path without importing the packages found."""
+    for module_info in pkgutil.iter_modules(path, prefix):
+        yield module_info.name
+        if module_info.ispkg:
+            name = module_info.name[len(prefix) :]
+            package_dir = os.path.join(module_info.module_finder.path, name)
+            yield from _walk_module_names([package_dir], module_info.name + ".")
 
 
 def test_package_structure():
@@ -19,9 +31,15 @@ def test_package_structure():
         "github_activity_tracker.utils.file_utils",
     ]
 
-    for module_name in core_modules:
-        spec = importlib.util.find_spec(module_name)
-        assert spec is not None, f"Module {module_name} not found"
+    spec = importlib.util.find_spec("github_activity_tracker")
+    assert spec is not None, "Module github_activity_tracker not found"
+
+    found = {"github_activity_tracker"}
+    found.update(
+        _walk_module_names(spec.submodule_search_locations, prefix="github_activity_tracker.")
+    )
+    missing = set(core_modules) - found
+    assert not missing, f"Modules not found: {sorted(missing)}"
 
 
 def test_version():
@@ -2,7 +2,7 @@
 
 import os
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import DEFAULT, patch
 
 import pandas as pd
 import pytest
@@ -11,9 +11,9 @@ from github_activity_tracker.report.generator import ReportGenerator
 from github_activity_tracker.report.visualization import ActivityVisualizer
 
 
-@pytest.fixture
-def sample_data():
-    """Create a sample DataFrame for testing."""
+@pytest.fixture(scope="module")
+def sample_frame():
+    """Create a sample DataFrame once for the module."""
     data = [
         {
             "user": "user1",
@@ -43,7 +43,13 @@ def sample_data():
             "details": {"title": "PR 3", "state": "closed", "number": 3, "comments": 0},
         },
     ]
-    return pd.DataFrame(data)
+    return pd.DataFrame(data, columns=["user", "date", "type", "repo", "id", "url", "details"])
+
+
+@pytest.fixture
+def sample_data(sample_frame):
+    """Shallow copy of the sample DataFrame, since plot_activity_trends rewrites "date"."""
+    return sample_frame.copy(deep=False)
 
 
 @patch("matplotlib.pyplot.savefig")
@@ -86,6 +92,16 @@ def test_plot_activity_types(mock_close, mock_savefig, sample_data, tmp_path):
     assert filename == os.path.join(output_dir, "activity_types.png")
 
 
+def test_generate_insights_without_matplotlib(sample_data, tmp_path):
+    """Test that insights are still generated, without charts, when matplotlib is missing."""
+    with patch("github_activity_tracker.report.visualization.plt", None):
+        insights = ActivityVisualizer.generate_insights(sample_data, str(tmp_path))
+
+    assert insights["total_activities"] == len(sample_data)
+    assert insights["graphs"] == {"trends": None, "types": None, "users": None}
+    assert os.listdir(tmp_path) == []
+
+
 @patch("github_activity_tracker.report.generator.ActivityVisualizer.generate_insights")
 @patch("github_activity_tracker.report.generator.shutil.copy2")
 @patch("github_activity_tracker.report.generator.Path.exists", return_value=True)
@@ -110,17 +126,14 @@ def test_generate_html_report(
     # Create a template directory for testing
     os.makedirs(str(tmp_path / "templates"), exist_ok=True)
 
-    # Mock jinja2 template loader and other dependencies
-    with patch("github_activity_tracker.report.generator.jinja2.FileSystemLoader"), patch(
-        "github_activity_tracker.report.generator.jinja2.Environment"
-    ), patch(
-        "github_activity_tracker.report.generator.create_report_directory"
-    ) as mock_create_dir, patch("builtins.open", create=True), patch(
-        "github_activity_tracker.report.generator.os.path.join",
-        return_value=str(tmp_path / "index.html"),
-    ):
+    # Mock jinja2, the report directory and file writes
+    with patch.multiple(
+        "github_activity_tracker.report.generator",
+        jinja2=DEFAULT,
+        create_report_directory=DEFAULT,
+    ) as mocks, patch("builtins.open", create=True):
         # Mock the report directory
-        mock_create_dir.return_value = str(tmp_path)
+        mocks["create_report_directory"].return_value = str(tmp_path)
 
         # Call the method
         result = ReportGenerator._generate_html_report(sample_data)
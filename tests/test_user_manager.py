@@ -0,0 +1,207 @@
+"""Tests for the web UI user manager."""
+
+import json
+import os
+import stat
+from unittest.mock import Mock, patch
+
+import bcrypt
+import pytest
+
+from github_activity_tracker.web.auth import user_manager
+from github_activity_tracker.web.auth.user_manager import UserManager
+
+
+@pytest.fixture(params=["ijson", "json"])
+def users_parser(request, monkeypatch):
+    """Run a test with the streaming ijson parser and with the json.load fallback."""
+    if request.param == "ijson":
+        if user_manager.ijson is None:
+            pytest.skip("ijson is not installed")
+    else:
+        monkeypatch.setattr(user_manager, "ijson", None)
+    return request.param
+
+
+@pytest.fixture
+def write_users(tmp_path):
+    """Return a helper that writes JSON content to a users file and returns its path."""
+
+    def write(content):
+        path = tmp_path / "users.json"
+        path.write_text(json.dumps(content))
+        return str(path)
+
+    return write
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param({"notusers": [{"user_id": "alice", "username": "alice"}]}, id="no-users-key"),
+        pytest.param([{"user_id": "alice", "username": "alice"}], id="top-level-list"),
+        pytest.param({"users": [{"username": "alice"}]}, id="missing-user-id"),
+    ],
+)
+def test_load_users_rejects_invalid_format(users_parser, write_users, content):
+    """Test that both parsers reject users files without a valid users array."""
+    manager = UserManager(write_users(content))
+
+    assert manager.users == {}
+    assert manager.load_users() is False
+
+
+def test_save_users_keeps_file_mode(write_users):
+    """Test that saving replaces the users file without changing its permissions."""
+    users_file = write_users({"users": [{"user_id": "alice", "username": "alice"}]})
+    os.chmod(users_file, 0o644)
+    manager = UserManager(users_file)
+
+    assert manager.save_users() is True
+    assert stat.S_IMODE(os.stat(users_file).st_mode) == 0o644
+
+
+def test_verify_password_with_pepper(write_users):
+    """Test that a user's stored hash verifies with the manager's pepper."""
+    manager = UserManager(
+        write_users({"users": [{"user_id": "alice", "username": "alice", "password": "s3cret"}]})
+    )
+    user = manager.get_user("alice")
+
+    assert user.verify_password("s3cret", manager.pepper) is True
+    assert user.verify_password("wrong", manager.pepper) is False
+
+
+def test_authenticate_without_readable_pepper(write_users, monkeypatch):
+    """Test that authentication fails closed when the pepper file cannot be created."""
+    manager = UserManager(write_users({"users": []}))
+    monkeypatch.setattr(
+        user_manager, "_load_pepper", Mock(side_effect=PermissionError("read-only directory"))
+    )
+
+    assert manager.authenticate("nobody", "s3cret") is None
+
+
+def test_plaintext_passwords_migrated_on_load(write_users):
+    """Test that plaintext passwords and _old_password backups are replaced on load."""
+    users_file = write_users(
+        {
+            "users": [
+                {
+                    "user_id": "alice",
+                    "username": "alice",
+                    "password": "s3cret",
+                    "_old_password": "s3cret",
+                }
+            ]
+        }
+    )
+
+    manager = UserManager(users_file)
+
+    with open(users_file) as f:
+        (record,) = json.load(f)["users"]
+    assert "password" not in record
+    assert "_old_password" not in record
+    assert record["password_hash"].startswith("$argon2id$")
+    assert manager.authenticate("alice", "s3cret").user_id == "alice"
+
+
+@pytest.mark.parametrize("prehashed", [False, True], ids=["raw", "sha256"])
+def test_legacy_bcrypt_login_upgraded_to_argon2(tmp_path, write_users, prehashed):
+    """Test that a successful login re-hashes a legacy bcrypt hash with argon2id."""
+    pepper = b"p" * 32
+    (tmp_path / "users.pepper").write_bytes(pepper)
+    if prehashed:
+        legacy_hash = user_manager.PREHASH_PREFIX + bcrypt.hashpw(
+            user_manager._prehash("s3cret", pepper), bcrypt.gensalt(rounds=4)
+        ).decode("ascii")
+    else:
+        legacy_hash = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode("ascii")
+    users_file = write_users(
+        {"users": [{"user_id": "alice", "username": "alice", "password_hash": legacy_hash}]}
+    )
+    manager = UserManager(users_file)
+
+    assert manager.authenticate("alice", "s3cret").user_id == "alice"
+
+    with open(users_file) as f:
+        (record,) = json.load(f)["users"]
+    assert record["password_hash"].startswith("$argon2id$")
+    assert manager.authenticate("alice", "s3cret").user_id == "alice"
+
+
+def test_authenticate_wrong_password(write_users):
+    """Test that a wrong password is rejected without changing the stored hash."""
+    manager = UserManager(
+        write_users({"users": [{"user_id": "alice", "username": "alice", "password": "s3cret"}]})
+    )
+    stored_hash = manager.users["alice"]["password_hash"]
+
+    assert manager.authenticate("alice", "wrong") is None
+    assert manager.users["alice"]["password_hash"] == stored_hash
+
+
+def test_authenticate_unknown_user(write_users):
+    """Test that an unknown username is rejected after a check against the dummy hash."""
+    manager = UserManager(
+        write_users({"users": [{"user_id": "alice", "username": "alice", "password": "s3cret"}]})
+    )
+
+    with patch.object(
+        user_manager, "_check_password", wraps=user_manager._check_password
+    ) as check_password:
+        assert manager.authenticate("bob", "s3cret") is None
+
+    check_password.assert_called_once_with("s3cret", user_manager._DUMMY_HASH, manager.pepper)
+
+
+@pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+def test_save_load_round_trip(users_parser, write_users, pretty):
+    """Test that saved users load back unchanged, with normalized records."""
+    manager = UserManager(write_users({"users": []}))
+    manager.add_user({"user_id": "alice", "username": "alice", "password": "s3cret"})
+    manager.add_user({"user_id": "bob", "username": "bob", "password": "hunter2", "is_admin": True})
+
+    assert manager.save_users(pretty=pretty) is True
+    reloaded = UserManager(manager.users_file)
+
+    assert reloaded.users == manager.users
+    assert reloaded.users["alice"]["email"] is None
+    assert reloaded.get_user("bob").is_admin is True
+    assert reloaded.authenticate("bob", "hunter2").username == "bob"
+
+
+def test_missing_pepper_not_recreated_for_existing_hashes(tmp_path, write_users):
+    """Test that a lost pepper file is reported instead of silently replaced."""
+    manager = UserManager(
+        write_users({"users": [{"user_id": "alice", "username": "alice", "password": "s3cret"}]})
+    )
+    pepper_file = tmp_path / "users.pepper"
+    pepper_file.unlink()
+
+    reloaded = UserManager(manager.users_file)
+
+    assert reloaded.authenticate("alice", "s3cret") is None
+    assert not pepper_file.exists()
+
+
+def test_truncated_pepper_rejected(tmp_path, write_users):
+    """Test that an empty or short pepper file is not used."""
+    (tmp_path / "users.pepper").write_bytes(b"")
+    manager = UserManager(write_users({"users": []}))
+
+    assert manager.authenticate("nobody", "s3cret") is None
+    with pytest.raises(ValueError, match="truncated"):
+        user_manager._load_pepper(manager.pepper_file)
+
+
+def test_pepper_created_for_new_users_file(tmp_path, write_users):
+    """Test that a pepper is created with owner-only permissions when none is needed yet."""
+    manager = UserManager(write_users({"users": []}))
+
+    assert len(manager.pepper) == user_manager.PEPPER_BYTES
+    pepper_file = tmp_path / "users.pepper"
+    assert pepper_file.read_bytes() == manager.pepper
+    assert stat.S_IMODE(os.stat(pepper_file).st_mode) == 0o600
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["users.json", "users.pepper"]
@@ -1,49 +1,65 @@
 """Tests for utility functions in the github_activity_tracker.utils package."""
 
 import os
-import tempfile
-from unittest.mock import MagicMock, patch
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from unittest.mock import patch
+
+import pytest
 
 from github_activity_tracker.utils import load_users_from_file
-from github_activity_tracker.utils.email_sender import EmailSender
+from github_activity_tracker.utils.email_sender import EmailSender, SMTPPool, close_smtp_pools
+
+
+@pytest.fixture(scope="module")
+def email_sender():
+    """EmailSender shared by the send tests; the pools it uses are closed after every test."""
+    return EmailSender(
+        smtp_server="smtp.example.com",
+        smtp_port=587,
+        username="test@example.com",
+        password="password123",
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_smtp_pools():
+    """Keep pooled SMTP connections from leaking between tests."""
+    yield
+    close_smtp_pools()
 
 
-def test_load_users_from_nonexistent_file():
+@pytest.fixture
+def smtp_mocks():
+    """Patch smtplib.SMTP with a mock whose connections pass the pool's NOOP health check."""
+    with patch("smtplib.SMTP") as mock_smtp:
+        mock_smtp.return_value.noop.return_value = (250, b"OK")
+        yield mock_smtp
+
+
+def test_load_users_from_nonexistent_file(tmp_path):
     """Test loading users from a nonexistent file."""
-    result = load_users_from_file("nonexistent_file.txt")
+    result = load_users_from_file(str(tmp_path / "missing.txt"))
     assert result is None
 
 
-def test_load_users_from_empty_file():
+def test_load_users_from_empty_file(users_file_factory):
     """Test loading users from an empty file."""
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as f:
-        pass  # Create empty file
-
-    try:
-        result = load_users_from_file(f.name)
-        assert result == []
-    finally:
-        # Clean up the file
-        os.unlink(f.name)
+    result = load_users_from_file(users_file_factory(""))
+    assert result == []
 
 
-def test_load_users_from_file():
+def test_load_users_from_file(users_file_factory):
     """Test loading users from a file with valid content."""
     expected_users = ["user1", "user2", "user3"]
 
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as f:
-        f.write("\n".join(expected_users))
-        f.flush()
+    result = load_users_from_file(users_file_factory("\n".join(expected_users)))
+    assert result == expected_users
 
-    try:
-        result = load_users_from_file(f.name)
-        assert result == expected_users
-    finally:
-        # Clean up the file
-        os.unlink(f.name)
 
-
-def test_load_users_with_comments_and_blanks():
+def test_load_users_with_comments_and_blanks(users_file_factory):
     """Test loading users from a file with comments and blank lines."""
     file_content = """
     # This is a comment
@@ -55,16 +71,44 @@ def test_load_users_with_comments_and_blanks():
     """
     expected_users = ["user1", "user2", "user3"]
 
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as f:
-        f.write(file_content)
-        f.flush()
-
-    try:
-        result = load_users_from_file(f.name)
-        assert result == expected_users
-    finally:
-        # Clean up the file
-        os.unlink(f.name)
+    result = load_users_from_file(users_file_factory(file_content))
+    assert result == expected_users
+
+
+def test_load_users_mixed_file_parity(users_file_factory):
+    """Test that a large mixed file loads the same users as a plain strip-and-filter pass."""
+    templates = [
+        "user{}",
+        "  user{}  ",
+        "\tuser{}\r",
+        "# user{}",
+        "   # user{}",
+        "",
+        "   ",
+        "a b{}",
+    ]
+    file_content = "\n".join(templates[i % len(templates)].format(i) for i in range(10_000))
+    expected_users = [
+        line.strip()
+        for line in file_content.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+    result = load_users_from_file(users_file_factory(file_content))
+    assert result == expected_users
+
+
+def test_load_users_large_file(users_file_factory):
+    """Test loading a large users file with comments and blank lines mixed in."""
+    expected_users = [f"user{i}" for i in range(100_000)]
+    lines = []
+    for index, user in enumerate(expected_users):
+        if index % 10 == 0:
+            lines.extend(["# comment", ""])
+        lines.append(f"  {user}  ")
+
+    result = load_users_from_file(users_file_factory("\n".join(lines)))
+    assert result == expected_users
 
 
 @patch.dict(
@@ -106,144 +150,206 @@ def test_email_sender_disabled():
     pass
 
 
-@patch("datetime.datetime")
-@patch("smtplib.SMTP")
-def test_send_html_report(mock_smtp, mock_datetime):
-    """Test sending an HTML report via email."""
-    # Mock datetime to avoid timedelta issue
-    mock_now = MagicMock()
-    mock_datetime.now.return_value = mock_now
-    mock_now.__sub__.return_value.strftime.return_value = "2023-01-01"
-    mock_now.strftime.return_value = "2023-01-31"
-
-    # Create a mock SMTP instance
-    mock_smtp_instance = MagicMock()
-    mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
-
-    # Create a temporary directory to simulate an HTML report
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create a mock HTML file
-        html_path = os.path.join(temp_dir, "index.html")
-        with open(html_path, "w") as f:
-            f.write("<html><body>Test report</body></html>")
-
-        # Create the sender with required parameters
-        sender = EmailSender(
-            smtp_server="smtp.example.com",
-            smtp_port=587,
-            username="test@example.com",
-            password="password123",
-        )
-
-        # Patch the _prepare_html_report_email method to return predictable values
-        with patch.object(
-            sender,
-            "_prepare_html_report_email",
-            return_value=("html content", "text content", [], {}),
-        ):
-            # Call send_report with proper parameters
-            result = sender.send_report(
+@pytest.mark.parametrize(
+    "format_name, report_file, report_path, prepared, sent",
+    [
+        pytest.param(
+            "html", "index.html", "", ("html content", "text content", [], {}), True, id="html"
+        ),
+        pytest.param(
+            "csv", "report.csv", "report.csv", ("html content", "text content", []), True, id="csv"
+        ),
+        pytest.param("csv", None, "missing.csv", None, False, id="missing"),
+    ],
+)
+def test_send_report(
+    smtp_mocks, email_sender, tmp_path, format_name, report_file, report_path, prepared, sent
+):
+    """Test sending HTML, CSV and missing reports twice over the same sender."""
+    mock_smtp_instance = smtp_mocks.return_value
+    if report_file:
+        (tmp_path / report_file).write_text("Test report")
+
+    # Patch the _prepare_*_report_email method to return predictable values
+    with patch.object(
+        email_sender, f"_prepare_{format_name}_report_email", return_value=prepared
+    ) as prepare:
+        results = [
+            email_sender.send_report(
                 recipient="recipient@example.com",
-                report_path=temp_dir,
+                report_path=str(tmp_path / report_path),
+                format_name=format_name,
                 date_from="2023-01-01",
                 date_to="2023-01-31",
             )
+            for _ in range(2)
+        ]
+
+    assert results == [sent, sent]
+    if sent:
+        # A single SMTP connection is opened, logged into once and reused
+        smtp_mocks.assert_called_once_with("smtp.example.com", 587)
+        mock_smtp_instance.login.assert_called_once_with("test@example.com", "password123")
+        assert mock_smtp_instance.sendmail.call_count == 2
+    else:
+        # A missing report is rejected before any email content is built or sent
+        prepare.assert_not_called()
+        smtp_mocks.assert_not_called()
+
+
+def test_send_report_without_report_path(smtp_mocks, email_sender, caplog):
+    """Test that a report email without a report path is refused up front."""
+    result = email_sender.send_report(recipient="recipient@example.com")
+
+    assert result is False
+    smtp_mocks.assert_not_called()
+    assert [record.getMessage() for record in caplog.records if record.levelname == "ERROR"] == [
+        "No report path given, nothing to send"
+    ]
+
+
+def test_send_report_large_csv_compressed(email_sender, tmp_path):
+    """Test that a CSV report above the size threshold is attached gzip-compressed."""
+    csv_path = tmp_path / "report.csv"
+    rows = "".join(
+        f"user{i % 50},2023-01-{i % 28 + 1:02d},PullRequestEvent\n" for i in range(70_000)
+    )
+    csv_path.write_text("user,date,type\n" + rows)
+    original_size = csv_path.stat().st_size
+    assert original_size > 1024 * 1024
 
-            # Assert the email was sent successfully
-            assert result is True
-            # Check that SMTP was initialized correctly
-            mock_smtp.assert_called_with("smtp.example.com", 587)
-            # Check that login was called
-            mock_smtp_instance.login.assert_called_with("test@example.com", "password123")
-            # Check that sendmail was called
-            mock_smtp_instance.sendmail.assert_called_once()
-
-
-@patch("datetime.datetime")
-@patch("smtplib.SMTP")
-def test_send_csv_report(mock_smtp, mock_datetime):
-    """Test sending a CSV report via email."""
-    # Mock datetime to avoid timedelta issue
-    mock_now = MagicMock()
-    mock_datetime.now.return_value = mock_now
-    mock_now.__sub__.return_value.strftime.return_value = "2023-01-01"
-    mock_now.strftime.return_value = "2023-01-31"
-
-    # Create a mock SMTP instance
-    mock_smtp_instance = MagicMock()
-    mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
-
-    # Create a temporary CSV file
-    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as temp_file:
-        temp_file.write(b"user,date,type\nuser1,2023-01-01,PR\n")
-
-    try:
-        # Create the sender with required parameters
-        sender = EmailSender(
-            smtp_server="smtp.example.com",
-            smtp_port=587,
-            username="test@example.com",
-            password="password123",
-        )
+    msg, _ = email_sender._build_message(
+        "recipient@example.com", report_path=str(csv_path), format_name="csv"
+    )
 
-        # Patch the _prepare_csv_report_email method to return predictable values
-        with patch.object(
-            sender, "_prepare_csv_report_email", return_value=("html content", "text content", [])
-        ):
-            # Call send_report with proper parameters
-            result = sender.send_report(
-                recipient="recipient@example.com",
-                report_path=temp_file.name,
-                format_name="csv",
-                date_from="2023-01-01",
-                date_to="2023-01-31",
-            )
+    attachment = next(part for part in msg.walk() if part.get_filename())
+    assert attachment.get_filename() == "github_activity_report.csv.gz"
+    assert len(attachment.get_payload(decode=True)) < 0.6 * original_size
 
-            # Assert the email was sent successfully
-            assert result is True
-            # Check that SMTP was initialized correctly
-            mock_smtp.assert_called_with("smtp.example.com", 587)
-            # Check that login was called
-            mock_smtp_instance.login.assert_called_with("test@example.com", "password123")
-            # Check that sendmail was called
-            mock_smtp_instance.sendmail.assert_called_once()
-    finally:
-        # Clean up the file
-        os.unlink(temp_file.name)
-
-
-@patch("datetime.datetime")
-@patch("smtplib.SMTP")
-def test_send_report_nonexistent_file(mock_smtp, mock_datetime):
-    """Test sending a nonexistent report."""
-    # Mock datetime to avoid timedelta issue
-    mock_now = MagicMock()
-    mock_datetime.now.return_value = mock_now
-    mock_now.__sub__.return_value.strftime.return_value = "2023-01-01"
-    mock_now.strftime.return_value = "2023-01-31"
-
-    # Create the sender with required parameters
-    sender = EmailSender(
-        smtp_server="smtp.example.com",
-        smtp_port=587,
-        username="test@example.com",
-        password="password123",
-    )
 
-    # Create a new test case: based on the implementation in email_sender.py,
-    # the CSV report doesn't check if the file exists before processing it,
-    # it just tries to generate generic email content. However, this should be
-    # improved in a future version. For now, we'll check that sendmail is called.
-
-    # Try to send a nonexistent report
-    result = sender.send_report(
-        recipient="recipient@example.com",
-        report_path="/nonexistent/file.csv",
-        format_name="csv",
-        date_from="2023-01-01",
-        date_to="2023-01-31",
+def test_pool_reuses_connections(smtp_mocks):
+    """Test that concurrent sends share at most max_connections SMTP connections."""
+    pool = SMTPPool("smtp.example.com", 587, "test@example.com", "password123", max_connections=5)
+
+    def send(index):
+        with pool.acquire() as smtp:
+            smtp.sendmail("test@example.com", ["recipient@example.com"], f"message {index}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(send, range(20)))
+    pool.close()
+
+    assert smtp_mocks.call_count <= 5
+    assert smtp_mocks.return_value.sendmail.call_count == 20
+
+
+def test_pool_shared_per_account_and_tls(smtp_mocks):
+    """Test that senders share a pool only with the same TLS setting and password."""
+    sender = EmailSender("smtp.example.com", 587, "pool@example.com", "password1")
+    plain_sender = EmailSender(
+        "smtp.example.com", 587, "pool@example.com", "password1", use_tls=False
     )
 
-    # Assert the email was sent (this is the current behavior of the implementation)
-    assert result is True
-    mock_smtp.assert_called_once()
+    assert EmailSender("smtp.example.com", 587, "pool@example.com", "password1").pool is sender.pool
+    assert plain_sender.pool is not sender.pool
+    assert (sender.pool.use_tls, plain_sender.pool.use_tls) == (True, False)
+
+    # An idle connection logged in with the old password is closed when it changes
+    with patch.object(sender, "_build_message", return_value=(MIMEText("report"), ["a@b.c"])):
+        assert sender.send_report(recipient="a@b.c") is True
+    new_sender = EmailSender("smtp.example.com", 587, "pool@example.com", "password2")
+
+    assert new_sender.pool is not sender.pool
+    assert sender.pool.password == "password1"
+    smtp_mocks.return_value.quit.assert_called_once()
+
+
+def test_send_reports_batch(smtp_mocks, email_sender):
+    """Test that a batch of reports goes out over one connection with RSET between emails."""
+    mock_smtp_instance = smtp_mocks.return_value
+    reports = [{"recipient": f"recipient{i}@example.com"} for i in range(10)]
+
+    with patch.object(
+        email_sender, "_build_message", return_value=(MIMEText("report"), ["recipient@example.com"])
+    ):
+        results = email_sender.send_reports_batch(reports)
+
+    assert results == [True] * 10
+    smtp_mocks.assert_called_once_with("smtp.example.com", 587)
+    mock_smtp_instance.login.assert_called_once()
+    assert mock_smtp_instance.send_message.call_count == 10
+    assert mock_smtp_instance.rset.call_count == 9
+
+
+def test_send_reports_batch_skips_rejected_message(smtp_mocks, email_sender):
+    """Test that a refused recipient mid-batch does not stop the later reports."""
+    mock_smtp_instance = smtp_mocks.return_value
+    refused = smtplib.SMTPRecipientsRefused({"recipient1@example.com": (550, b"No such user")})
+    mock_smtp_instance.send_message.side_effect = [None, refused, None]
+    reports = [{"recipient": f"recipient{i}@example.com"} for i in range(3)]
+
+    with patch.object(
+        email_sender, "_build_message", side_effect=lambda recipient: (MIMEText(recipient), [])
+    ):
+        results = email_sender.send_reports_batch(reports)
+
+    assert results == [True, False, True]
+    smtp_mocks.assert_called_once()
+    assert mock_smtp_instance.send_message.call_count == 3
+    assert mock_smtp_instance.rset.call_count == 2
+
+
+def test_send_report_multi_builds_once(smtp_mocks, email_sender, tmp_path):
+    """Test that one report sent to many recipients is only built once."""
+    mock_smtp_instance = smtp_mocks.return_value
+    report_file = tmp_path / "report.csv"
+    report_file.write_text("id,name\n1,test\n")
+    recipients = [f"recipient{i}@example.com" for i in range(10)]
+
+    with patch.object(
+        email_sender, "_build_message", wraps=email_sender._build_message
+    ) as build_message:
+        results = email_sender.send_report_multi(
+            recipients, report_path=str(report_file), format_name="csv"
+        )
+
+    assert results == [True] * 10
+    build_message.assert_called_once()
+    smtp_mocks.assert_called_once_with("smtp.example.com", 587)
+    assert mock_smtp_instance.send_message.call_count == 10
+    sent_to = [call.kwargs["to_addrs"] for call in mock_smtp_instance.send_message.call_args_list]
+    assert sent_to == [[recipient] for recipient in recipients]
+
+
+def test_send_report_multi_skips_rejected_recipient(smtp_mocks, email_sender):
+    """Test that a refused recipient does not stop delivery to the ones after it."""
+    mock_smtp_instance = smtp_mocks.return_value
+    refused = smtplib.SMTPRecipientsRefused({"recipient1@example.com": (550, b"No such user")})
+    mock_smtp_instance.send_message.side_effect = [None, refused, None]
+    recipients = [f"recipient{i}@example.com" for i in range(3)]
+
+    with patch.object(email_sender, "_build_message", return_value=(MIMEText("report"), [])):
+        results = email_sender.send_report_multi(recipients)
+
+    assert results == [True, False, True]
+    sent_to = [call.kwargs["to_addrs"] for call in mock_smtp_instance.send_message.call_args_list]
+    assert sent_to == [[recipient] for recipient in recipients]
+    assert mock_smtp_instance.rset.call_count == 2
+
+
+def test_send_reports_parallel(smtp_mocks, email_sender):
+    """Test that parallel sends overlap and share the pooled connections."""
+    mock_smtp_instance = smtp_mocks.return_value
+    # Every send waits for three others, which only completes if four run at once
+    in_flight = threading.Barrier(4, timeout=5)
+    mock_smtp_instance.sendmail.side_effect = lambda *args: in_flight.wait()
+    jobs = [{"recipient": f"recipient{i}@example.com"} for i in range(20)]
+
+    with patch.object(
+        email_sender, "_build_message", return_value=(MIMEText("report"), ["recipient@example.com"])
+    ):
+        results = email_sender.send_reports_parallel(jobs, max_workers=4)
+
+    assert results == [True] * 20
+    assert mock_smtp_instance.sendmail.call_count == 20
+    assert smtp_mocks.call_count <= 4